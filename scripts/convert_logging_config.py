@@ -0,0 +1,40 @@
+"""Convert the YAML logging configuration to JSON for faster startup.
+
+``setup_logging`` prefers ``config/logging.json`` over ``config/logging.yaml``
+while the JSON file is not older than the YAML one. The YAML file stays the
+source of truth: re-run this script after editing it.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import yaml
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Write a JSON copy of a YAML logging config.
+
+    Args:
+        argv: Optional ``[source, target]`` paths; defaults to
+            ``config/logging.yaml`` and the same path with a ``.json`` suffix
+
+    Returns:
+        Process exit code
+    """
+    args = sys.argv[1:] if argv is None else argv
+    source = Path(args[0]) if args else CONFIG_DIR / "logging.yaml"
+    target = Path(args[1]) if len(args) > 1 else source.with_suffix(".json")
+
+    with open(source, encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+
+    target.write_text(json.dumps(config, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {target} from {source}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -192,6 +192,7 @@ def main():
     config = get_config()
 
     tracker = BenchmarkTracker()
+    # Metadata changes are written by a background thread; close() drains its queue
     data_manager = DataManager(config)
 
     print_section("🚀 Starting Incremental ETL Pipeline")
@@ -321,7 +322,7 @@ def main():
 
             with BenchmarkContext(tracker, "olap_cubes"):
                 cube = OLAPCube(config)
-                cube.create_cubes(db_conn)
+                cube.refresh_cubes(db_conn)
 
                 cube_summary = cube.get_cube_summary(db_conn)
                 for cube_name, info in cube_summary.items():
@@ -358,6 +359,8 @@ def main():
         print(f"\n❌ Error during ETL pipeline: {e}")
         tracker.logger.error(f"ETL pipeline failed: {e}", exc_info=True)
         return 1
+    finally:
+        data_manager.close()
 
 
 def table_exists(conn: duckdb.DuckDBPyConnection, table_name: str) -> bool:
@@ -107,10 +107,9 @@ with st.sidebar:
             
             result = conn.execute("""
                 SELECT 
-                    MIN(t.datetime) as min_date,
-                    MAX(t.datetime) as max_date
+                    MIN(f.event_time) as min_date,
+                    MAX(f.event_time) as max_date
                 FROM fact_earthquakes f
-                JOIN dim_time t ON f.time_id = t.time_id
             """).fetchone()
             
             if result:
@@ -85,7 +85,7 @@ try:
             COUNT(*) AS daily_event_count,
             AVG(m.magnitude) AS daily_avg_magnitude,
             MAX(m.magnitude) AS daily_max_magnitude,
-            SUM(m.energy_joules) AS daily_total_energy,
+            SUM(f.energy_joules) AS daily_total_energy,
             COUNT(DISTINCT l.region) AS affected_regions
         FROM fact_earthquakes f
         JOIN dim_time t ON f.time_id = t.time_id
@@ -389,7 +389,7 @@ try:
             COUNT(*) AS daily_event_count,
             AVG(m.magnitude) AS daily_avg_magnitude,
             MAX(m.magnitude) AS daily_max_magnitude,
-            SUM(m.energy_joules) AS daily_total_energy,
+            SUM(f.energy_joules) AS daily_total_energy,
             COUNT(DISTINCT l.region) AS affected_regions
         FROM fact_earthquakes f
         JOIN dim_time t ON f.time_id = t.time_id
@@ -176,7 +176,7 @@ try:
         map_data_query = f"""
         SELECT
             f.event_id,
-            t.datetime,
+            f.event_time AS datetime,
             l.latitude,
             l.longitude,
             l.place,
@@ -192,7 +192,7 @@ try:
         WHERE m.magnitude >= {min_magnitude}
             AND t.date >= '{start_date}'
             AND t.date <= '{end_date}'
-        ORDER BY m.magnitude DESC, t.datetime DESC
+        ORDER BY m.magnitude DESC, f.event_time DESC
         LIMIT {max_events}
         """
         
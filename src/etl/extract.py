@@ -1,14 +1,17 @@
 """Data extraction module for parsing CSV files."""
 
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
-import pandas as pd
 import polars as pl
 
 from src.utils.config import Config, get_config
 from src.utils.logger import LoggerMixin, print_info, print_success, print_warning
 
+if TYPE_CHECKING:
+    # pandas/pyarrow are only needed on the fallback path and are imported lazily
+    import pandas as pd
+
 
 class DataExtractor(LoggerMixin):
     """Extract and parse earthquake data from CSV files."""
@@ -21,7 +24,7 @@ class DataExtractor(LoggerMixin):
         """
         self.config = config or get_config()
 
-    def extract_csv(self, file_path: Path, use_polars: bool = True) -> pl.DataFrame | pd.DataFrame:
+    def extract_csv(self, file_path: Path, use_polars: bool = True) -> "pl.DataFrame | pd.DataFrame":
         """Extract data from CSV file.
 
         Args:
@@ -81,9 +84,9 @@ class DataExtractor(LoggerMixin):
         except Exception as e:
             self.logger.error(f"Polars extraction failed: {e}")
             self.logger.info("Falling back to Pandas")
-            return pl.from_pandas(self._extract_with_pandas(file_path))
+            return self._pandas_to_polars(self._extract_with_pandas(file_path))
 
-    def _extract_with_pandas(self, file_path: Path) -> pd.DataFrame:
+    def _extract_with_pandas(self, file_path: Path) -> "pd.DataFrame":
         """Extract using Pandas (fallback option).
 
         Args:
@@ -92,11 +95,39 @@ class DataExtractor(LoggerMixin):
         Returns:
             Pandas DataFrame
         """
-        df = pd.read_csv(file_path, low_memory=False)
+        import pandas as pd
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+
+        # Multi-threaded Arrow CSV parser (what pd.read_csv(engine="pyarrow") uses).
+        # Keep the ISO timestamps as strings - the transformer parses them itself.
+        convert_options = pa_csv.ConvertOptions(
+            column_types={"time": pa.string(), "updated": pa.string()}
+        )
+        table = pa_csv.read_csv(file_path, convert_options=convert_options)
+
+        # Arrow-backed columns convert to Polars without copying
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
         self.logger.info("Extraction completed with Pandas")
         return df
 
-    def get_schema_info(self, df: Union[pl.DataFrame, pd.DataFrame]) -> dict:
+    def _pandas_to_polars(self, df: "pd.DataFrame") -> pl.DataFrame:
+        """Hand a Pandas DataFrame to Polars through Arrow.
+
+        Numeric columns are passed through without copying, unlike
+        ``pl.from_pandas`` which copies object-dtype columns.
+
+        Args:
+            df: Pandas DataFrame
+
+        Returns:
+            Polars DataFrame
+        """
+        import pyarrow as pa
+
+        return pl.from_arrow(pa.Table.from_pandas(df, preserve_index=False))
+
+    def get_schema_info(self, df: Union[pl.DataFrame, "pd.DataFrame"]) -> dict:
         """Get schema information from DataFrame.
 
         Args:
@@ -121,8 +152,8 @@ class DataExtractor(LoggerMixin):
             }
 
     def preview_data(
-        self, df: Union[pl.DataFrame, pd.DataFrame], n_rows: int = 5
-    ) -> Union[pl.DataFrame, pd.DataFrame]:
+        self, df: Union[pl.DataFrame, "pd.DataFrame"], n_rows: int = 5
+    ) -> Union[pl.DataFrame, "pd.DataFrame"]:
         """Preview first n rows of data.
 
         Args:
@@ -173,9 +204,9 @@ class DataExtractor(LoggerMixin):
                 self.logger.warning(f"Skipping empty file: {file_path.name}")
                 continue
             
-            # Convert to Polars if needed
-            if isinstance(df, pd.DataFrame):
-                df = pl.from_pandas(df)
+            # Convert to Polars if needed (pandas fallback)
+            if not isinstance(df, pl.DataFrame):
+                df = self._pandas_to_polars(df)
             
             dfs.append(df)
             total_rows += len(df)
@@ -38,12 +38,14 @@ class DataLoader(LoggerMixin):
             
             self.conn = duckdb.connect(str(self.db_path))
 
-            # Configure DuckDB for large datasets
-            self.conn.execute(f"SET memory_limit='{self.config.duckdb.memory_limit}'")
-            self.conn.execute(f"SET threads={self.config.duckdb.threads}")
-            self.conn.execute(f"SET temp_directory='{temp_dir}'")
-            self.conn.execute(f"SET max_temp_directory_size='{self.config.duckdb.max_temp_directory_size}'")
-            self.conn.execute(f"SET preserve_insertion_order={str(self.config.duckdb.preserve_insertion_order).lower()}")
+            # Configure DuckDB for large datasets (single multi-statement call)
+            self.conn.execute(
+                f"SET memory_limit='{self.config.duckdb.memory_limit}'; "
+                f"SET threads={self.config.duckdb.threads}; "
+                f"SET temp_directory='{temp_dir}'; "
+                f"SET max_temp_directory_size='{self.config.duckdb.max_temp_directory_size}'; "
+                f"SET preserve_insertion_order={str(self.config.duckdb.preserve_insertion_order).lower()}"
+            )
 
             print_success(f"Connected to DuckDB: {self.db_path.name}")
 
@@ -71,8 +73,22 @@ class DataLoader(LoggerMixin):
         # Drop table if exists
         conn.execute(f"DROP TABLE IF EXISTS {table_name}")
 
-        # Create table from DataFrame
-        conn.execute(f"CREATE TABLE {table_name} AS SELECT * FROM df")
+        # Create table from the DataFrame's Arrow buffers (zero-copy)
+        relation = conn.from_arrow(df.to_arrow())
+
+        # Store rows sorted on the common filter keys so DuckDB's per-row-group
+        # min/max zonemaps can skip data for time and magnitude range predicates
+        sort_keys = [col for col in ("datetime", "magnitude") if col in df.columns]
+        if sort_keys:
+            conn.execute("SET preserve_insertion_order=true")
+            try:
+                relation.order(", ".join(sort_keys)).create(table_name)
+            finally:
+                conn.execute(
+                    f"SET preserve_insertion_order={str(self.config.duckdb.preserve_insertion_order).lower()}"
+                )
+        else:
+            relation.create(table_name)
 
         # Verify load
         result = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()
@@ -109,13 +125,20 @@ class DataLoader(LoggerMixin):
         print_success("Table optimized for queries")
 
     def export_to_parquet(
-        self, table_name: str = "raw_earthquakes", output_path: Optional[Path] = None
+        self,
+        table_name: str = "raw_earthquakes",
+        output_path: Optional[Path] = None,
+        row_group_size: int = 128_000,
+        compression: str = "zstd",
     ) -> Path:
         """Export table to Parquet format for efficient storage.
 
         Args:
             table_name: Name of the table to export
             output_path: Path for output file (auto-generated if None)
+            row_group_size: Rows per Parquet row group (smaller groups allow
+                finer-grained parallel reads)
+            compression: Parquet compression codec
 
         Returns:
             Path to exported Parquet file
@@ -128,7 +151,12 @@ class DataLoader(LoggerMixin):
         self.logger.info(f"Exporting {table_name} to Parquet: {output_path}")
         print_info(f"Exporting to Parquet format...")
 
-        conn.execute(f"COPY {table_name} TO '{output_path}' (FORMAT PARQUET)")
+        # Refresh table statistics before the export scan
+        conn.execute(f"ANALYZE {table_name}")
+        conn.execute(
+            f"COPY {table_name} TO '{output_path}' "
+            f"(FORMAT PARQUET, COMPRESSION '{compression}', ROW_GROUP_SIZE {row_group_size})"
+        )
 
         file_size = output_path.stat().st_size
         self.logger.info(f"Exported to {output_path} ({file_size:,} bytes)")
@@ -1,17 +1,84 @@
 """Data transformation module for cleaning and enriching earthquake data."""
 
-from skyfield import almanac
-from skyfield.api import load
-
+import threading
 from datetime import datetime
-from typing import Optional, Union
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
+import numpy as np
 import polars as pl
-import pandas as pd
 
 from src.utils.config import Config, get_config
 from src.utils.logger import LoggerMixin, print_info, print_success, print_warning
 
+if TYPE_CHECKING:
+    # pandas and skyfield are only needed on optional paths and are imported lazily
+    import pandas as pd
+
+# Standardized columns consumed by the transform steps and the star schema;
+# everything else is dropped unless etl.keep_raw_columns is set
+REQUIRED_COLUMNS = frozenset({
+    "time",
+    "latitude",
+    "longitude",
+    "depth",
+    "magnitude",
+    "magnitude_type",
+    "num_stations",
+    "azimuthal_gap",
+    "min_distance",
+    "rms",
+    "network",
+    "event_id",
+    "place",
+    "event_type",
+    "horizontal_error",
+    "depth_error",
+    "magnitude_error",
+    "status",
+})
+
+# Skyfield timescale and JPL ephemeris, shared by every transformer in the process
+_ephemeris: Optional[Tuple] = None
+_ephemeris_lock = threading.Lock()
+
+# Phase bin edges and names; both ends of the cycle map to "New Moon"
+_MOON_PHASE_EDGES = np.array([0.0625, 0.1875, 0.3125, 0.4375, 0.5625, 0.6875, 0.8125, 0.9375])
+_MOON_PHASE_NAMES = np.array([
+    "New Moon",
+    "Waxing Crescent",
+    "First Quarter",
+    "Waxing Gibbous",
+    "Full Moon",
+    "Waning Gibbous",
+    "Last Quarter",
+    "Waning Crescent",
+    "New Moon",
+])
+
+
+def _load_ephemeris(cache_dir: Path) -> Tuple:
+    """Load the Skyfield timescale and DE421 ephemeris once per process.
+
+    Args:
+        cache_dir: Directory where Skyfield keeps its downloaded data files
+
+    Returns:
+        Tuple of (timescale, ephemeris)
+    """
+    global _ephemeris
+
+    if _ephemeris is None:
+        from skyfield.api import Loader
+
+        with _ephemeris_lock:
+            if _ephemeris is None:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                loader = Loader(str(cache_dir))
+                _ephemeris = (loader.timescale(), loader("de421.bsp"))
+
+    return _ephemeris
+
 
 class DataTransformer(LoggerMixin):
     """Transform and clean earthquake data."""
@@ -25,7 +92,7 @@ class DataTransformer(LoggerMixin):
         self.config = config or get_config()
         self.validation_config = self.config.etl.validation
 
-    def transform(self, df: Union[pl.DataFrame, pd.DataFrame]) -> pl.DataFrame:
+    def transform(self, df: Union[pl.DataFrame, "pd.DataFrame"]) -> pl.DataFrame:
         """Apply all transformations to the data.
 
         Args:
@@ -38,13 +105,15 @@ class DataTransformer(LoggerMixin):
         print_info("Transforming earthquake data...")
 
         # Convert to Polars if needed
-        if isinstance(df, pd.DataFrame):
+        if not isinstance(df, pl.DataFrame):
             df = pl.from_pandas(df)
 
         initial_rows = len(df)
 
         # Apply transformations
         df = self._standardize_columns(df)
+        if not self.config.etl.keep_raw_columns:
+            df = self._prune_columns(df)
         df = self._clean_data(df)
         df = self._validate_data(df)
         df = self._enrich_data(df)
@@ -107,6 +176,24 @@ class DataTransformer(LoggerMixin):
 
         return df
 
+    def _prune_columns(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Drop columns that no later step uses, so they are not carried through every pass.
+
+        Args:
+            df: DataFrame with standardized columns
+
+        Returns:
+            DataFrame restricted to required and configured extra columns
+        """
+        keep = REQUIRED_COLUMNS.union(self.config.etl.extra_columns)
+        dropped = [col for col in df.columns if col not in keep]
+
+        if dropped:
+            self.logger.info(f"Dropping unused columns: {dropped}")
+            df = df.select([col for col in df.columns if col in keep])
+
+        return df
+
     def _clean_data(self, df: pl.DataFrame) -> pl.DataFrame:
         """Clean the data by handling nulls and invalid values.
 
@@ -185,9 +272,7 @@ class DataTransformer(LoggerMixin):
 
         # Parse time field and extract components
         if "time" in df.columns:
-            df = df.with_columns([
-                pl.col("time").str.strptime(pl.Datetime, "%Y-%m-%dT%H:%M:%S%.3fZ").alias("datetime"),
-            ])
+            df = df.with_columns([self._parse_time(df["time"]).alias("datetime")])
 
             df = df.with_columns([
                 pl.col("datetime").dt.year().alias("year"),
@@ -197,31 +282,29 @@ class DataTransformer(LoggerMixin):
                 pl.col("datetime").dt.weekday().alias("day_of_week"),
             ])
 
-        # Add magnitude categories
+        # Add magnitude categories (left-closed bins: [3.0, 5.0) -> Light, ...)
         if "magnitude" in df.columns:
             df = df.with_columns([
-                pl.when(pl.col("magnitude") < 3.0)
-                .then(pl.lit("Minor"))
-                .when(pl.col("magnitude") < 5.0)
-                .then(pl.lit("Light"))
-                .when(pl.col("magnitude") < 6.0)
-                .then(pl.lit("Moderate"))
-                .when(pl.col("magnitude") < 7.0)
-                .then(pl.lit("Strong"))
-                .when(pl.col("magnitude") < 8.0)
-                .then(pl.lit("Major"))
-                .otherwise(pl.lit("Great"))
+                pl.col("magnitude")
+                .cut(
+                    breaks=[3.0, 5.0, 6.0, 7.0, 8.0],
+                    labels=["Minor", "Light", "Moderate", "Strong", "Major", "Great"],
+                    left_closed=True,
+                )
+                .cast(pl.Utf8)
                 .alias("magnitude_category")
             ])
 
         # Add depth categories
         if "depth" in df.columns:
             df = df.with_columns([
-                pl.when(pl.col("depth") < 70)
-                .then(pl.lit("Shallow"))
-                .when(pl.col("depth") < 300)
-                .then(pl.lit("Intermediate"))
-                .otherwise(pl.lit("Deep"))
+                pl.col("depth")
+                .cut(
+                    breaks=[70, 300],
+                    labels=["Shallow", "Intermediate", "Deep"],
+                    left_closed=True,
+                )
+                .cast(pl.Utf8)
                 .alias("depth_category")
             ])
 
@@ -236,9 +319,48 @@ class DataTransformer(LoggerMixin):
 
         return df
 
+    def _parse_time(self, time_col: pl.Series) -> pl.Expr:
+        """Build the expression that parses USGS timestamps into datetimes.
+
+        USGS always emits fixed-width ``YYYY-MM-DDTHH:MM:SS.fffZ`` strings, so
+        when every value has that shape the fields are sliced out by position
+        and cast directly, skipping the strptime format interpreter.
+
+        Args:
+            time_col: Raw ``time`` column
+
+        Returns:
+            Expression producing a millisecond-precision datetime
+        """
+        time = pl.col("time")
+
+        # Both shape checks run as one expression, in a single query
+        is_fixed_width = time_col.dtype == pl.Utf8 and time_col.to_frame("time").select(
+            ((time.str.len_bytes() == 24) & time.str.ends_with("Z")).all()
+        ).item()
+        if not is_fixed_width:
+            return time.str.strptime(pl.Datetime, "%Y-%m-%dT%H:%M:%S%.3fZ")
+
+        def field(offset: int, length: int) -> pl.Expr:
+            return time.str.slice(offset, length).cast(pl.Int32)
+
+        return pl.datetime(
+            field(0, 4),
+            field(5, 2),
+            field(8, 2),
+            field(11, 2),
+            field(14, 2),
+            field(17, 2),
+            field(20, 3) * 1000,
+            time_unit="ms",
+        )
+
     def _add_moon_phase(self, df: pl.DataFrame) -> pl.DataFrame:
         """Add moon phase information to the data.
 
+        Uses the closed-form lunation approximation by default; set
+        ``etl.high_accuracy_moon_phase`` to use the Skyfield/JPL ephemeris.
+
         Args:
             df: Input DataFrame with datetime column
 
@@ -251,14 +373,74 @@ class DataTransformer(LoggerMixin):
             self.logger.warning("No datetime column found, skipping moon phase enrichment")
             return df
 
-        # Load ephemeris data (downloads if not cached)
+        if self.config.etl.high_accuracy_moon_phase:
+            moon_phases, moon_phase_names = self._moon_phase_skyfield(df["datetime"])
+        else:
+            moon_phases = self._moon_phase_fast(df["datetime"])
+            moon_phase_names = _MOON_PHASE_NAMES[np.digitize(moon_phases, _MOON_PHASE_EDGES)]
+
+        # Add to dataframe
+        df = df.with_columns([
+            pl.Series("moon_phase", moon_phases, dtype=pl.Float64),
+            pl.Series("moon_phase_name", moon_phase_names, dtype=pl.Utf8),
+        ])
+
+        self.logger.info("Moon phase data added successfully")
+
+        return df
+
+    def _moon_phase_fast(self, dt_series: pl.Series) -> np.ndarray:
+        """Approximate moon phase from the Moon-Sun elongation (Meeus, ch. 48).
+
+        The mean elongation alone drifts up to about +/-7 degrees from the true
+        phase (the true new moon is up to ~14 h off the mean one), so the six
+        largest periodic terms are added; the result is within about 0.2
+        degrees of the true elongation, close enough that phase names match
+        the Skyfield path except within minutes of a boundary.
+
+        Args:
+            dt_series: Series of UTC datetimes
+
+        Returns:
+            Array of phase values (0 = new moon, 0.5 = full moon)
+        """
+        seconds = dt_series.to_numpy().astype("datetime64[s]").astype(np.float64)
+        jd = seconds / 86400.0 + 2440587.5  # Unix epoch as Julian day
+        t = (jd - 2451545.0) / 36525.0  # Julian centuries since J2000.0
+
+        # Mean elongation of the Moon, mean anomalies of the Sun and the Moon
+        d = np.radians(297.8501921 + 445267.1114034 * t)
+        m = np.radians(357.5291092 + 35999.0502909 * t)
+        m_moon = np.radians(134.9633964 + 477198.8675055 * t)
+
+        elongation = (
+            np.degrees(d)
+            + 6.289 * np.sin(m_moon)
+            - 2.100 * np.sin(m)
+            + 1.274 * np.sin(2 * d - m_moon)
+            + 0.658 * np.sin(2 * d)
+            + 0.214 * np.sin(2 * m_moon)
+            + 0.110 * np.sin(d)
+        )
+        return (elongation / 360.0) % 1.0
+
+    def _moon_phase_skyfield(self, dt_series: pl.Series) -> Tuple[List[float], List[str]]:
+        """Calculate moon phase from the JPL DE421 ephemeris via Skyfield.
+
+        Args:
+            dt_series: Series of datetimes
+
+        Returns:
+            Tuple of (phase values, phase names)
+        """
+        # Load ephemeris data (downloaded into the cache dir on first use)
+        from skyfield import almanac
         from skyfield.api import utc
-        
-        ts = load.timescale()
-        eph = load('de421.bsp')  # JPL ephemeris
+
+        ts, eph = _load_ephemeris(self.config.paths.cache_dir / "skyfield")
 
         # Convert datetime to list for processing
-        datetimes = df["datetime"].to_list()
+        datetimes = dt_series.to_list()
 
         moon_phases = []
         moon_phase_names = []
@@ -310,15 +492,7 @@ class DataTransformer(LoggerMixin):
                 moon_phases.append(0.0)
                 moon_phase_names.append("Unknown")
 
-        # Add to dataframe
-        df = df.with_columns([
-            pl.Series("moon_phase", moon_phases),
-            pl.Series("moon_phase_name", moon_phase_names),
-        ])
-
-        self.logger.info("Moon phase data added successfully")
-
-        return df
+        return moon_phases, moon_phase_names
 
     def get_summary_statistics(self, df: pl.DataFrame) -> dict:
         """Get summary statistics of the transformed data.
@@ -1,9 +1,13 @@
 """OLAP cube creation and management."""
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence, Tuple
 
 import duckdb
 
+from src.olap.queries import TOP_EVENTS_ROWS, invalidate_query_cache
 from src.utils.config import Config, get_config
 from src.utils.logger import LoggerMixin, print_info, print_success
 
@@ -11,6 +15,109 @@ from src.utils.logger import LoggerMixin, print_info, print_success
 class OLAPCube(LoggerMixin):
     """Create and manage OLAP cubes for multi-dimensional analysis."""
 
+    _CUBE_TABLES = (
+        "cube_time_magnitude",
+        "cube_location_magnitude",
+        "cube_region_rollup",
+        "cube_depth_analysis",
+        "cube_temporal_trends",
+        "cube_moon_phase",
+        "top_magnitude_events",
+    )
+
+    # Star-schema lookup tables the cube queries join; exported with the cubes
+    # so Parquet-backed readers can answer those queries too
+    _LOOKUP_TABLES = (
+        "dim_category_order",
+        "dim_moon_phase",
+    )
+
+    # Columns of the joined fact table that cubes may group by; dimension
+    # names are interpolated into SQL, so anything else is rejected
+    _DIMENSION_COLUMNS = frozenset({
+        "date", "year", "month", "day_of_week", "day_name", "hour", "season", "is_weekend",
+        "magnitude_category", "magnitude_group", "depth_category",
+        "region", "hemisphere_ns", "hemisphere_ew", "climate_zone",
+        "moon_phase_id",
+    })
+
+    # Dimensions each cube groups by. The lite profile keeps only the columns
+    # the predefined queries read, for small interactive or development builds
+    _DIM_PROFILES = {
+        "full": {
+            "cube_time_magnitude": (
+                "year", "month", "day_name", "hour", "season", "is_weekend", "magnitude_category",
+            ),
+            "cube_location_magnitude": (
+                "region", "hemisphere_ns", "hemisphere_ew", "climate_zone", "magnitude_category",
+            ),
+            "cube_depth_analysis": ("depth_category", "magnitude_category", "season"),
+            "cube_temporal_trends": ("date", "year", "month", "day_of_week"),
+            "cube_moon_phase": ("moon_phase_id", "magnitude_group"),
+        },
+        "lite": {
+            "cube_time_magnitude": ("hour", "season", "magnitude_category"),
+            "cube_location_magnitude": ("region", "magnitude_category"),
+            "cube_depth_analysis": ("depth_category", "magnitude_category"),
+            "cube_temporal_trends": ("date", "year", "month", "day_of_week"),
+            "cube_moon_phase": ("moon_phase_id", "magnitude_group"),
+        },
+    }
+
+    # Measures per cube: output column -> (aggregate expression, merge rule
+    # used by refresh_cubes, or None when the measure cannot be merged)
+    _CUBE_MEASURES = {
+        "cube_time_magnitude": {
+            "event_count": ("COUNT(*)", "sum"),
+            "avg_magnitude": ("AVG(magnitude)", "avg"),
+            "min_magnitude": ("MIN(magnitude)", "min"),
+            "max_magnitude": ("MAX(magnitude)", "max"),
+            "avg_depth": ("AVG(depth)", "avg"),
+            "total_energy": ("SUM(energy_joules)", "sum"),
+        },
+        "cube_location_magnitude": {
+            "event_count": ("COUNT(*)", "sum"),
+            "avg_magnitude": ("AVG(magnitude)", "avg"),
+            "max_magnitude": ("MAX(magnitude)", "max"),
+            "avg_depth": ("AVG(depth)", "avg"),
+            "center_latitude": ("AVG(latitude)", "avg"),
+            "center_longitude": ("AVG(longitude)", "avg"),
+        },
+        "cube_depth_analysis": {
+            "event_count": ("COUNT(*)", "sum"),
+            "avg_depth": ("AVG(depth)", "avg"),
+            "avg_magnitude": ("AVG(magnitude)", "avg"),
+            "avg_stations": ("AVG(num_stations)", "avg"),
+            "avg_gap": ("AVG(azimuthal_gap)", "avg"),
+            "avg_horizontal_error": ("AVG(horizontal_error)", "avg"),
+            "avg_depth_error": ("AVG(depth_error)", "avg"),
+        },
+        "cube_temporal_trends": {
+            "daily_event_count": ("COUNT(*)", None),
+            "daily_avg_magnitude": ("AVG(magnitude)", None),
+            "daily_max_magnitude": ("MAX(magnitude)", None),
+            "daily_total_energy": ("SUM(energy_joules)", None),
+            "affected_regions": ("approx_count_distinct(region)", None),
+        },
+        "cube_moon_phase": {
+            "event_count": ("COUNT(*)", "sum"),
+            "avg_magnitude": ("AVG(magnitude)", "avg"),
+            "max_magnitude": ("MAX(magnitude)", "max"),
+            "avg_depth": ("AVG(depth)", "avg"),
+        },
+    }
+
+    # Averages are weighted by the event counts on each side of the merge
+    _MERGE_RULES = {
+        "sum": "c.{col} + d.{col}",
+        "min": "LEAST(c.{col}, d.{col})",
+        "max": "GREATEST(c.{col}, d.{col})",
+        "avg": (
+            "(c.{col} * c.event_count + d.{col} * d.event_count)"
+            " / (c.event_count + d.event_count)"
+        ),
+    }
+
     def __init__(self, config: Optional[Config] = None):
         """Initialize cube manager.
 
@@ -20,194 +127,727 @@ class OLAPCube(LoggerMixin):
         self.config = config or get_config()
         self.schema_config = self.config.duckdb.schema_tables
 
-    def create_cubes(self, conn: duckdb.DuckDBPyConnection) -> None:
+    def create_cubes(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        exact_region_counts: bool = False,
+        dim_profile: str = "full",
+    ) -> None:
         """Create all OLAP cubes.
 
         Args:
             conn: DuckDB connection
+            exact_region_counts: Use exact COUNT(DISTINCT) for affected regions
+                instead of the HyperLogLog approximation
+            dim_profile: Dimension set to build the cubes with ("full" or "lite")
+
+        Raises:
+            ValueError: If dim_profile is not a known profile
         """
-        self.logger.info("Creating OLAP cubes")
+        if dim_profile not in self._DIM_PROFILES:
+            raise ValueError(f"Unknown cube dimension profile: {dim_profile}")
+
+        self.logger.info(f"Creating OLAP cubes ({dim_profile} dimensions)")
         print_info("Creating OLAP cubes for analytics...")
 
-        self._create_time_magnitude_cube(conn)
-        self._create_location_magnitude_cube(conn)
-        self._create_depth_analysis_cube(conn)
-        self._create_temporal_trends_cube(conn)
-        self._create_moon_phase_cube(conn) 
+        # Refresh statistics so the join planner sees the dimensions as the
+        # small build sides and the fact as the probe side
+        source_tables = (
+            self.schema_config.get("fact_table", "fact_earthquakes"),
+            self.schema_config.get("dim_time", "dim_time"),
+            self.schema_config.get("dim_location", "dim_location"),
+            self.schema_config.get("dim_magnitude", "dim_magnitude"),
+        )
+        for table in source_tables:
+            conn.execute(f"ANALYZE {table}")
+
+        # Join the fact to its dimensions once; every cube aggregates this table
+        self._build_joined_fact(conn)
+
+        builders = [
+            partial(self._create_time_magnitude_cube, dim_profile=dim_profile),
+            partial(self._create_location_magnitude_cube, dim_profile=dim_profile),
+            partial(self._create_depth_analysis_cube, dim_profile=dim_profile),
+            partial(
+                self._create_temporal_trends_cube,
+                exact=exact_region_counts,
+                dim_profile=dim_profile,
+            ),
+            partial(self._create_moon_phase_cube, dim_profile=dim_profile),
+        ]
+
+        try:
+            # Cubes only read fact_joined and write distinct tables, so each one
+            # is built concurrently on its own cursor
+            with ThreadPoolExecutor(max_workers=len(builders)) as executor:
+                futures = [
+                    executor.submit(self._run_on_cursor, conn, builder) for builder in builders
+                ]
+                for future in as_completed(futures):
+                    future.result()
+
+            # Rolled up from cube_location_magnitude, so it runs once that exists
+            self._create_region_rollup_cube(conn)
+            self._create_top_events_table(conn)
+            self._record_refresh_state(conn, dim_profile)
+        finally:
+            conn.execute("DROP TABLE IF EXISTS fact_joined")
+            invalidate_query_cache()
+
+        self.export_cubes_to_parquet(conn)
 
         print_success("OLAP cubes created successfully")
 
-    def _create_time_magnitude_cube(self, conn: duckdb.DuckDBPyConnection) -> None:
-        """Create cube for time-based magnitude analysis.
+    def refresh_cubes(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        exact_region_counts: bool = False,
+        dim_profile: str = "full",
+    ) -> None:
+        """Bring the cubes up to date with facts appended since the last build.
+
+        Assumes the fact table is append-only in event-time order, i.e. new
+        events get time_ids above every fact already aggregated. As time_ids
+        are hours, new events in the last aggregated hour trigger a rebuild. Only the new
+        facts are aggregated and merged into the existing cube rows. Daily
+        trends are recomputed from the first day with new events instead,
+        since distinct region counts cannot be merged. Falls back to
+        create_cubes when there is no refresh state, the cubes were built with
+        another dimension profile, or earlier facts changed. Changes are
+        detected by row count and by a content fingerprint, so facts rebuilt
+        from revised raw data (e.g. by create_star_schema) are not missed.
 
         Args:
             conn: DuckDB connection
+            exact_region_counts: Use exact COUNT(DISTINCT) for affected regions
+                instead of the HyperLogLog approximation
+            dim_profile: Dimension set the cubes are built with ("full" or "lite")
         """
-        self.logger.info("Creating cube_time_magnitude")
+        self.logger.info("Refreshing OLAP cubes")
+
+        state = self._read_refresh_state(conn)
+        if state is None or state[3] != dim_profile:
+            self.logger.info("No matching cube refresh state found, rebuilding all cubes")
+            self.create_cubes(
+                conn, exact_region_counts=exact_region_counts, dim_profile=dim_profile
+            )
+            return
+
+        last_time_id, fact_row_count, fact_fingerprint, _ = state
+        fact_table = self.schema_config.get("fact_table", "fact_earthquakes")
+        dim_time = self.schema_config.get("dim_time", "dim_time")
+
+        result = conn.execute(
+            f"""
+            SELECT
+                COUNT(*) FILTER (WHERE time_id <= ?),
+                SUM(hash(f)) FILTER (WHERE time_id <= ?),
+                COUNT(*)
+            FROM {fact_table} f
+            """,
+            [last_time_id, last_time_id],
+        ).fetchone()
+        aggregated_rows, aggregated_fingerprint, total_rows = result if result else (0, None, 0)
+
+        if aggregated_rows != fact_row_count or aggregated_fingerprint != fact_fingerprint:
+            self.logger.warning("Previously aggregated facts changed, rebuilding all cubes")
+            self.create_cubes(
+                conn, exact_region_counts=exact_region_counts, dim_profile=dim_profile
+            )
+            return
+
+        if total_rows == fact_row_count:
+            print_info("OLAP cubes are up to date")
+            return
+
+        print_info(f"Refreshing OLAP cubes with {total_rows - fact_row_count:,} new events...")
+
+        # Daily trends restart at the first day with new events; as time_ids
+        # follow event time, that day's facts all have time_id >= tail_start
+        tail_date, tail_start = conn.execute(
+            f"""
+            SELECT t.date, MIN(d.time_id)
+            FROM {dim_time} t
+            JOIN {dim_time} d ON d.date = t.date
+            WHERE t.time_id = (
+                SELECT MIN(time_id) FROM {fact_table} WHERE time_id > ?
+            )
+            GROUP BY t.date
+            """,
+            [last_time_id],
+        ).fetchone()
+
+        builders = {
+            "cube_time_magnitude": self._create_time_magnitude_cube,
+            "cube_location_magnitude": self._create_location_magnitude_cube,
+            "cube_depth_analysis": self._create_depth_analysis_cube,
+            "cube_moon_phase": self._create_moon_phase_cube,
+        }
+
+        self._build_joined_fact(conn, table="fact_tail", since_time_id=tail_start)
+        conn.execute(
+            f"CREATE OR REPLACE VIEW fact_delta AS "
+            f"SELECT * FROM fact_tail WHERE time_id > {int(last_time_id)}"
+        )
+
+        conn.begin()
+        try:
+            for cube_name, builder in builders.items():
+                builder(conn, source="fact_delta", table="cube_delta", dim_profile=dim_profile)
+                self._merge_cube_delta(conn, cube_name, "cube_delta", dim_profile)
+
+            conn.execute("DELETE FROM cube_temporal_trends WHERE date >= ?", [tail_date])
+            self._create_temporal_trends_cube(
+                conn,
+                exact=exact_region_counts,
+                source="fact_tail",
+                table="cube_delta",
+                dim_profile=dim_profile,
+            )
+            conn.execute("INSERT INTO cube_temporal_trends SELECT * FROM cube_delta")
+
+            self._create_region_rollup_cube(conn)
+            self._create_top_events_table(conn)
+            self._record_refresh_state(conn, dim_profile)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.execute("DROP TABLE IF EXISTS cube_delta")
+            conn.execute("DROP VIEW IF EXISTS fact_delta")
+            conn.execute("DROP TABLE IF EXISTS fact_tail")
+            invalidate_query_cache()
+
+        self.export_cubes_to_parquet(conn)
+
+        print_success("OLAP cubes refreshed successfully")
+
+    def export_cubes_to_parquet(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        output_dir: Optional[Path] = None,
+        compression: str = "zstd",
+    ) -> Dict[str, Path]:
+        """Write every cube, and the lookup tables they join, to Parquet files.
+
+        Other processes can then read the cubes through register_cube_views
+        without opening (and locking) the DuckDB database file.
 
-        sql = """
-        CREATE OR REPLACE TABLE cube_time_magnitude AS
+        Args:
+            conn: DuckDB connection
+            output_dir: Directory for the cube files (defaults to
+                <processed_dir>/cubes)
+            compression: Parquet compression codec
+
+        Returns:
+            Dictionary mapping table names to their Parquet paths
+        """
+        output_dir = output_dir or self._cube_parquet_dir()
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        paths = {}
+        for table in self._CUBE_TABLES + self._LOOKUP_TABLES:
+            path = output_dir / f"{table}.parquet"
+            conn.execute(f"COPY {table} TO '{path}' (FORMAT PARQUET, COMPRESSION '{compression}')")
+            paths[table] = path
+
+        self.logger.info(f"Exported {len(paths)} cube and lookup tables to {output_dir}")
+        return paths
+
+    def register_cube_views(
+        self, conn: duckdb.DuckDBPyConnection, cube_dir: Optional[Path] = None
+    ) -> None:
+        """Expose exported cube and lookup Parquet files as views on a reader connection.
+
+        Meant for connections that do not hold the cube tables, such as an
+        in-memory connection in the dashboard; a view cannot replace a table
+        of the same name. OLAPQueries methods that read only cube tables and
+        the dim_category_order / dim_moon_phase lookups work unchanged against
+        these views.
+
+        Args:
+            conn: DuckDB connection
+            cube_dir: Directory holding the cube files (defaults to
+                <processed_dir>/cubes)
+        """
+        cube_dir = cube_dir or self._cube_parquet_dir()
+
+        # Cache Parquet metadata across queries on this connection
+        conn.execute("SET enable_object_cache=true")
+        tables = self._CUBE_TABLES + self._LOOKUP_TABLES
+        for table in tables:
+            path = cube_dir / f"{table}.parquet"
+            conn.execute(f"CREATE OR REPLACE VIEW {table} AS SELECT * FROM read_parquet('{path}')")
+
+        self.logger.info(f"Registered {len(tables)} cube and lookup views from {cube_dir}")
+
+    def _cube_parquet_dir(self) -> Path:
+        """Get the default directory for exported cube Parquet files.
+
+        Returns:
+            Path to the cube directory
+        """
+        return self.config.paths.processed_dir / "cubes"
+
+    def _merge_cube_delta(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        cube_name: str,
+        delta_table: str,
+        dim_profile: str = "full",
+    ) -> None:
+        """Merge an aggregate of new facts into an existing cube.
+
+        Args:
+            conn: DuckDB connection
+            cube_name: Cube to update, all of its measures must have a merge rule
+            delta_table: Cube-shaped aggregate of the new facts
+            dim_profile: Dimension set the cube was built with
+        """
+        group_cols = self._DIM_PROFILES[dim_profile][cube_name]
+        measures = self._CUBE_MEASURES[cube_name]
+        match = " AND ".join(f"c.{col} IS NOT DISTINCT FROM d.{col}" for col in group_cols)
+        assignments = ",\n".join(
+            f"{col} = {self._MERGE_RULES[rule].format(col=col)}"
+            for col, (_, rule) in measures.items()
+        )
+
+        conn.execute(f"""
+            UPDATE {cube_name} AS c
+            SET {assignments}
+            FROM {delta_table} AS d
+            WHERE {match}
+        """)
+        conn.execute(f"""
+            INSERT INTO {cube_name}
+            SELECT d.* FROM {delta_table} AS d
+            WHERE NOT EXISTS (SELECT 1 FROM {cube_name} AS c WHERE {match})
+        """)
+
+    def _record_refresh_state(
+        self, conn: duckdb.DuckDBPyConnection, dim_profile: str = "full"
+    ) -> None:
+        """Record the fact watermark the cubes were last built from.
+
+        Besides the row count, the sum of row hashes over the fact table is
+        stored as a fingerprint of the aggregated facts.
+
+        Args:
+            conn: DuckDB connection
+            dim_profile: Dimension set the cubes were built with
+        """
+        fact_table = self.schema_config.get("fact_table", "fact_earthquakes")
+
+        conn.execute(
+            f"""
+            CREATE OR REPLACE TABLE cube_refresh_state AS
+            SELECT
+                c.cube_name,
+                f.max_time_id AS last_refreshed_time_id,
+                f.row_count AS fact_row_count,
+                f.fingerprint AS fact_fingerprint,
+                ? AS dim_profile,
+                CAST(now() AS TIMESTAMP) AS refreshed_at
+            FROM (
+                SELECT
+                    MAX(time_id) AS max_time_id,
+                    COUNT(*) AS row_count,
+                    SUM(hash(x)) AS fingerprint
+                FROM {fact_table} x
+            ) f, unnest(?::VARCHAR[]) AS c(cube_name)
+            """,
+            [dim_profile, list(self._CUBE_TABLES)],
+        )
+
+    def _read_refresh_state(
+        self, conn: duckdb.DuckDBPyConnection
+    ) -> Optional[Tuple[int, int, Optional[int], str]]:
+        """Read the fact watermark shared by all cubes.
+
+        Args:
+            conn: DuckDB connection
+
+        Returns:
+            Tuple of (last refreshed time_id, fact row count, fact
+            fingerprint, dimension profile), or None when any cube is missing
+            or lacks a consistent refresh state
+        """
+        summary = self.get_cube_summary(conn)
+        if not all(info["exists"] for info in summary.values()):
+            return None
+
+        try:
+            result = conn.execute(
+                """
+                SELECT
+                    COUNT(DISTINCT cube_name),
+                    MIN(last_refreshed_time_id),
+                    MAX(last_refreshed_time_id),
+                    MIN(fact_row_count),
+                    MAX(fact_row_count),
+                    COUNT(DISTINCT fact_fingerprint),
+                    ANY_VALUE(fact_fingerprint),
+                    COUNT(DISTINCT dim_profile),
+                    ANY_VALUE(dim_profile)
+                FROM cube_refresh_state
+                WHERE list_contains(?, cube_name)
+                """,
+                [list(self._CUBE_TABLES)],
+            ).fetchone()
+        except (duckdb.CatalogException, duckdb.BinderException):
+            return None
+
+        if not result or result[0] != len(self._CUBE_TABLES) or result[1] is None:
+            return None
+        if result[1] != result[2] or result[3] != result[4] or result[5] != 1 or result[7] != 1:
+            return None
+
+        return result[1], result[3], result[6], result[8]
+
+    @staticmethod
+    def _run_on_cursor(
+        conn: duckdb.DuckDBPyConnection,
+        builder: Callable[[duckdb.DuckDBPyConnection], None],
+    ) -> None:
+        """Run a cube builder on a dedicated cursor of the shared database.
+
+        Args:
+            conn: DuckDB connection
+            builder: Cube creation method
+        """
+        cursor = conn.cursor()
+        try:
+            builder(cursor)
+        finally:
+            cursor.close()
+
+    def _build_joined_fact(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        table: str = "fact_joined",
+        since_time_id: Optional[int] = None,
+    ) -> None:
+        """Materialize the fact table joined to all dimensions.
+
+        Only the columns referenced by the cubes are kept, so the join result
+        is produced once instead of once per cube. This is a regular table
+        (not TEMP) so the per-cube cursors can read it.
+
+        Args:
+            conn: DuckDB connection
+            table: Name of the table to create
+            since_time_id: Only include facts with time_id at or above this
+        """
+        self.logger.info(f"Creating {table}")
+
+        fact_table = self.schema_config.get("fact_table", "fact_earthquakes")
+        dim_time = self.schema_config.get("dim_time", "dim_time")
+        dim_location = self.schema_config.get("dim_location", "dim_location")
+        dim_magnitude = self.schema_config.get("dim_magnitude", "dim_magnitude")
+
+        where_clause = "" if since_time_id is None else f"WHERE f.time_id >= {int(since_time_id)}"
+
+        sql = f"""
+        CREATE OR REPLACE TABLE {table} AS
         SELECT
+            f.time_id,
+            f.depth,
+            f.depth_category,
+            f.num_stations,
+            f.azimuthal_gap,
+            f.horizontal_error,
+            f.depth_error,
+            f.energy_joules,
+            f.moon_phase_id,
+            t.date,
             t.year,
             t.month,
+            t.day_of_week,
             t.day_name,
             t.hour,
             t.season,
             t.is_weekend,
+            m.magnitude,
             m.magnitude_category,
-            COUNT(*) AS event_count,
-            AVG(m.magnitude) AS avg_magnitude,
-            MIN(m.magnitude) AS min_magnitude,
-            MAX(m.magnitude) AS max_magnitude,
-            AVG(f.depth) AS avg_depth,
-            SUM(m.energy_joules) AS total_energy
-        FROM fact_earthquakes f
-        JOIN dim_time t ON f.time_id = t.time_id
-        JOIN dim_magnitude m ON f.magnitude_id = m.magnitude_id
-        GROUP BY 
-            t.year, t.month, t.day_name, t.hour, 
-            t.season, t.is_weekend, m.magnitude_category
+            m.magnitude_group,
+            l.region,
+            l.hemisphere_ns,
+            l.hemisphere_ew,
+            l.climate_zone,
+            l.latitude,
+            l.longitude
+        FROM {fact_table} f
+        JOIN {dim_time} t ON f.time_id = t.time_id
+        JOIN {dim_magnitude} m ON f.magnitude_id = m.magnitude_id
+        JOIN {dim_location} l ON f.location_id = l.location_id
+        {where_clause}
         """
 
         conn.execute(sql)
-        result = conn.execute("SELECT COUNT(*) FROM cube_time_magnitude").fetchone()
-        count = result[0] if result else 0
-        self.logger.info(f"Created cube_time_magnitude with {count:,} aggregations")
 
-    def _create_location_magnitude_cube(self, conn: duckdb.DuckDBPyConnection) -> None:
-        """Create cube for location-based magnitude analysis.
+    def _build_cube(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        name: str,
+        dims: Sequence[str],
+        aggs: Dict[str, str],
+        source: str = "fact_joined",
+        order_by: Optional[str] = None,
+    ) -> None:
+        """Create a cube table by grouping joined facts on the given dimensions.
 
         Args:
             conn: DuckDB connection
+            name: Name of the cube table to create
+            dims: Dimension columns to group by, from _DIMENSION_COLUMNS
+            aggs: Output column name to aggregate expression
+            source: Table of joined facts to aggregate
+            order_by: Dimension to order the stored rows by
+
+        Raises:
+            ValueError: If a dimension is not allowed or an output column name
+                is not a plain identifier
         """
-        self.logger.info("Creating cube_location_magnitude")
-
-        sql = """
-        CREATE OR REPLACE TABLE cube_location_magnitude AS
+        unknown = [dim for dim in dims if dim not in self._DIMENSION_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unsupported cube dimensions for {name}: {unknown}")
+        invalid = [alias for alias in aggs if not alias.isidentifier()]
+        if invalid:
+            raise ValueError(f"Invalid measure names for {name}: {invalid}")
+        if order_by is not None and order_by not in dims:
+            raise ValueError(f"Cannot order {name} by {order_by}, it is not a cube dimension")
+
+        self.logger.info(f"Creating {name}")
+
+        select_list = ",\n            ".join(
+            [*dims, *(f"{expression} AS {alias}" for alias, expression in aggs.items())]
+        )
+        order_clause = f"ORDER BY {order_by}" if order_by else ""
+
+        sql = f"""
+        CREATE OR REPLACE TABLE {name} AS
         SELECT
-            l.region,
-            l.hemisphere_ns,
-            l.hemisphere_ew,
-            l.climate_zone,
-            m.magnitude_category,
-            COUNT(*) AS event_count,
-            AVG(m.magnitude) AS avg_magnitude,
-            MAX(m.magnitude) AS max_magnitude,
-            AVG(f.depth) AS avg_depth,
-            AVG(l.latitude) AS center_latitude,
-            AVG(l.longitude) AS center_longitude
-        FROM fact_earthquakes f
-        JOIN dim_location l ON f.location_id = l.location_id
-        JOIN dim_magnitude m ON f.magnitude_id = m.magnitude_id
-        GROUP BY 
-            l.region, l.hemisphere_ns, l.hemisphere_ew, 
-            l.climate_zone, m.magnitude_category
+            {select_list}
+        FROM {source}
+        GROUP BY {", ".join(dims)}
+        {order_clause}
         """
 
         conn.execute(sql)
-        result = conn.execute("SELECT COUNT(*) FROM cube_location_magnitude").fetchone()
+        result = conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()
         count = result[0] if result else 0
-        self.logger.info(f"Created cube_location_magnitude with {count:,} aggregations")
+        self.logger.info(f"Created {name} with {count:,} aggregations")
 
-    def _create_depth_analysis_cube(self, conn: duckdb.DuckDBPyConnection) -> None:
-        """Create cube for depth-based analysis.
+    def _cube_aggregates(self, cube_name: str) -> Dict[str, str]:
+        """Get a cube's measures as output column -> aggregate expression.
+
+        Args:
+            cube_name: Cube with an entry in _CUBE_MEASURES
+
+        Returns:
+            Dictionary of aggregate expressions
+        """
+        measures = self._CUBE_MEASURES[cube_name]
+        return {alias: expression for alias, (expression, _) in measures.items()}
+
+    def _create_time_magnitude_cube(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        source: str = "fact_joined",
+        table: str = "cube_time_magnitude",
+        dim_profile: str = "full",
+    ) -> None:
+        """Create cube for time-based magnitude analysis.
 
         Args:
             conn: DuckDB connection
+            source: Table of joined facts to aggregate
+            table: Name of the cube table to create
+            dim_profile: Dimension set to group by
         """
-        self.logger.info("Creating cube_depth_analysis")
+        self._build_cube(
+            conn,
+            table,
+            self._DIM_PROFILES[dim_profile]["cube_time_magnitude"],
+            self._cube_aggregates("cube_time_magnitude"),
+            source,
+        )
+
+    def _create_location_magnitude_cube(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        source: str = "fact_joined",
+        table: str = "cube_location_magnitude",
+        dim_profile: str = "full",
+    ) -> None:
+        """Create cube for location-based magnitude analysis.
 
-        sql = """
-        CREATE OR REPLACE TABLE cube_depth_analysis AS
-        SELECT
-            f.depth_category,
-            m.magnitude_category,
-            t.season,
-            COUNT(*) AS event_count,
-            AVG(f.depth) AS avg_depth,
-            AVG(m.magnitude) AS avg_magnitude,
-            AVG(f.num_stations) AS avg_stations,
-            AVG(f.azimuthal_gap) AS avg_gap,
-            AVG(f.horizontal_error) AS avg_horizontal_error,
-            AVG(f.depth_error) AS avg_depth_error
-        FROM fact_earthquakes f
-        JOIN dim_magnitude m ON f.magnitude_id = m.magnitude_id
-        JOIN dim_time t ON f.time_id = t.time_id
-        GROUP BY f.depth_category, m.magnitude_category, t.season
+        Args:
+            conn: DuckDB connection
+            source: Table of joined facts to aggregate
+            table: Name of the cube table to create
+            dim_profile: Dimension set to group by
         """
+        self._build_cube(
+            conn,
+            table,
+            self._DIM_PROFILES[dim_profile]["cube_location_magnitude"],
+            self._cube_aggregates("cube_location_magnitude"),
+            source,
+        )
 
-        conn.execute(sql)
-        result = conn.execute("SELECT COUNT(*) FROM cube_depth_analysis").fetchone()
-        count = result[0] if result else 0
-        self.logger.info(f"Created cube_depth_analysis with {count:,} aggregations")
+    def _create_region_rollup_cube(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Create per-region rollup of the location cube.
 
-    def _create_temporal_trends_cube(self, conn: duckdb.DuckDBPyConnection) -> None:
-        """Create cube for temporal trend analysis.
+        Averages are weighted by each cell's event count so they match a
+        direct aggregation of the fact table.
 
         Args:
             conn: DuckDB connection
         """
-        self.logger.info("Creating cube_temporal_trends")
+        self.logger.info("Creating cube_region_rollup")
 
         sql = """
-        CREATE OR REPLACE TABLE cube_temporal_trends AS
+        CREATE OR REPLACE TABLE cube_region_rollup AS
         SELECT
-            t.date,
-            t.year,
-            t.month,
-            t.day_of_week,
-            COUNT(*) AS daily_event_count,
-            AVG(m.magnitude) AS daily_avg_magnitude,
-            MAX(m.magnitude) AS daily_max_magnitude,
-            SUM(m.energy_joules) AS daily_total_energy,
-            COUNT(DISTINCT l.region) AS affected_regions
-        FROM fact_earthquakes f
-        JOIN dim_time t ON f.time_id = t.time_id
-        JOIN dim_magnitude m ON f.magnitude_id = m.magnitude_id
-        JOIN dim_location l ON f.location_id = l.location_id
-        GROUP BY t.date, t.year, t.month, t.day_of_week
-        ORDER BY t.date
+            region,
+            CAST(SUM(event_count) AS BIGINT) AS event_count,
+            SUM(avg_magnitude * event_count) / SUM(event_count) AS avg_magnitude,
+            MAX(max_magnitude) AS max_magnitude,
+            SUM(center_latitude * event_count) / SUM(event_count) AS center_latitude,
+            SUM(center_longitude * event_count) / SUM(event_count) AS center_longitude
+        FROM cube_location_magnitude
+        GROUP BY region
         """
 
         conn.execute(sql)
-        result = conn.execute("SELECT COUNT(*) FROM cube_temporal_trends").fetchone()
+        result = conn.execute("SELECT COUNT(*) FROM cube_region_rollup").fetchone()
         count = result[0] if result else 0
-        self.logger.info(f"Created cube_temporal_trends with {count:,} aggregations")
+        self.logger.info(f"Created cube_region_rollup with {count:,} aggregations")
 
-    def _create_moon_phase_cube(self, conn: duckdb.DuckDBPyConnection) -> None:
-        """Create cube for moon phase analysis.
+    def _create_top_events_table(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        k: int = TOP_EVENTS_ROWS,
+    ) -> None:
+        """Create leader table of the highest magnitude events.
+
+        Top event queries with a limit up to k read this table instead of
+        sorting the whole fact table.
 
         Args:
             conn: DuckDB connection
+            k: Number of events to keep
         """
-        self.logger.info("Creating cube_moon_phase")
+        self.logger.info("Creating top_magnitude_events")
 
-        sql = """
-        CREATE OR REPLACE TABLE cube_moon_phase AS
+        fact_table = self.schema_config.get("fact_table", "fact_earthquakes")
+        dim_location = self.schema_config.get("dim_location", "dim_location")
+        dim_magnitude = self.schema_config.get("dim_magnitude", "dim_magnitude")
+
+        sql = f"""
+        CREATE OR REPLACE TABLE top_magnitude_events AS
         SELECT
-            f.moon_phase_name,
-            f.moon_phase,
-            CASE 
-                WHEN m.magnitude < 4.0 THEN '1-3'
-                WHEN m.magnitude >= 4.0 AND m.magnitude < 5.0 THEN '4'
-                WHEN m.magnitude >= 5.0 AND m.magnitude < 6.0 THEN '5'
-                WHEN m.magnitude >= 6.0 AND m.magnitude < 8.0 THEN '6-7'
-                ELSE '8-9'
-            END AS magnitude_group,
-            COUNT(*) AS event_count,
-            AVG(m.magnitude) AS avg_magnitude,
-            MAX(m.magnitude) AS max_magnitude,
-            AVG(f.depth) AS avg_depth
-        FROM fact_earthquakes f
-        JOIN dim_magnitude m ON f.magnitude_id = m.magnitude_id
-        GROUP BY f.moon_phase_name, f.moon_phase, magnitude_group
-        ORDER BY f.moon_phase
+            f.event_id,
+            f.event_time AS datetime,
+            l.place,
+            l.region,
+            m.magnitude,
+            m.magnitude_category,
+            f.depth,
+            f.depth_category,
+            l.latitude,
+            l.longitude
+        FROM {fact_table} f
+        JOIN {dim_location} l ON f.location_id = l.location_id
+        JOIN {dim_magnitude} m ON f.magnitude_id = m.magnitude_id
+        ORDER BY m.magnitude DESC
+        LIMIT {int(k)}
         """
 
         conn.execute(sql)
-        result = conn.execute("SELECT COUNT(*) FROM cube_moon_phase").fetchone()
-        count = result[0] if result else 0
-        self.logger.info(f"Created cube_moon_phase with {count:,} aggregations")
+        self.logger.info(f"Created top_magnitude_events with up to {int(k):,} events")
+
+    def _create_depth_analysis_cube(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        source: str = "fact_joined",
+        table: str = "cube_depth_analysis",
+        dim_profile: str = "full",
+    ) -> None:
+        """Create cube for depth-based analysis.
+
+        Args:
+            conn: DuckDB connection
+            source: Table of joined facts to aggregate
+            table: Name of the cube table to create
+            dim_profile: Dimension set to group by
+        """
+        self._build_cube(
+            conn,
+            table,
+            self._DIM_PROFILES[dim_profile]["cube_depth_analysis"],
+            self._cube_aggregates("cube_depth_analysis"),
+            source,
+        )
+
+    def _create_temporal_trends_cube(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        exact: bool = False,
+        source: str = "fact_joined",
+        table: str = "cube_temporal_trends",
+        dim_profile: str = "full",
+    ) -> None:
+        """Create cube for temporal trend analysis.
+
+        Args:
+            conn: DuckDB connection
+            exact: Count affected regions exactly rather than with HyperLogLog
+            source: Table of joined facts to aggregate
+            table: Name of the cube table to create
+            dim_profile: Dimension set to group by
+        """
+        aggs = self._cube_aggregates("cube_temporal_trends")
+        if exact:
+            aggs["affected_regions"] = "COUNT(DISTINCT region)"
+
+        self._build_cube(
+            conn,
+            table,
+            self._DIM_PROFILES[dim_profile]["cube_temporal_trends"],
+            aggs,
+            source,
+            order_by="date",
+        )
+
+    def _create_moon_phase_cube(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        source: str = "fact_joined",
+        table: str = "cube_moon_phase",
+        dim_profile: str = "full",
+    ) -> None:
+        """Create cube for moon phase analysis.
+
+        Phases are grouped by their integer id; queries join dim_moon_phase
+        for the display name.
+
+        Args:
+            conn: DuckDB connection
+            source: Table of joined facts to aggregate
+            table: Name of the cube table to create
+            dim_profile: Dimension set to group by
+        """
+        self._build_cube(
+            conn,
+            table,
+            self._DIM_PROFILES[dim_profile]["cube_moon_phase"],
+            self._cube_aggregates("cube_moon_phase"),
+            source,
+            order_by="moon_phase_id",
+        )
 
     def get_cube_summary(self, conn: duckdb.DuckDBPyConnection) -> dict:
         """Get summary of all cubes.
@@ -218,16 +858,24 @@ class OLAPCube(LoggerMixin):
         Returns:
             Dictionary with cube summaries
         """
-        cubes = [
-            "cube_time_magnitude",
-            "cube_location_magnitude",
-            "cube_depth_analysis",
-            "cube_temporal_trends",
-            "cube_moon_phase",
-        ]
+        cubes = list(self._CUBE_TABLES)
+
+        # Row counts come from the catalog in one query instead of a scan per cube
+        rows = conn.execute(
+            """
+            SELECT table_name, estimated_size
+            FROM duckdb_tables()
+            WHERE database_name = current_database()
+                AND schema_name = current_schema()
+                AND list_contains(?, table_name)
+            """,
+            [cubes],
+        ).fetchall()
+        summary = {name: {"row_count": size, "exists": True} for name, size in rows}
 
-        summary = {}
         for cube in cubes:
+            if cube in summary:
+                continue
             try:
                 result = conn.execute(f"SELECT COUNT(*) FROM {cube}").fetchone()
                 count = result[0] if result else 0
@@ -235,4 +883,4 @@ class OLAPCube(LoggerMixin):
             except Exception as e:
                 summary[cube] = {"exists": False, "error": str(e)}
 
-        return summary
+        return {cube: summary[cube] for cube in cubes}
@@ -1,14 +1,138 @@
 """Pre-defined analytical queries for the OLAP system."""
 
-from typing import Any, List, Optional
+import functools
+import math
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, TypeVar, Union
 
 import duckdb
 import pandas as pd
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 from src.utils.config import Config, get_config
 from src.utils.logger import LoggerMixin
 
 
+# Rows per Arrow record batch when streaming map events
+MAP_STREAM_BATCH_ROWS = 5000
+
+# Events kept in the top_magnitude_events leader table built with the cubes
+TOP_EVENTS_ROWS = 1000
+
+_QueryMethod = TypeVar("_QueryMethod", bound=Callable[..., Any])
+
+# Query results are small and requested on every dashboard render, so they
+# are kept per connection until they expire or the cubes are rebuilt. Entries
+# go away with their connection, as the cache holds connections weakly
+_CACHE_MAXSIZE = 64
+_CACHE_TTL_SECONDS = 300.0
+_cache: "weakref.WeakKeyDictionary[duckdb.DuckDBPyConnection, OrderedDict[tuple, tuple]]" = (
+    weakref.WeakKeyDictionary()
+)
+_cache_lock = threading.Lock()
+
+
+def invalidate_query_cache() -> None:
+    """Drop all cached query results."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _data_version(conn: duckdb.DuckDBPyConnection) -> Any:
+    """Get a cheap marker that changes whenever the cubes are rebuilt.
+
+    Cube builds, including those run by the ETL in another process, rewrite
+    cube_refresh_state, so its refresh time tells cached results from before
+    a rebuild apart from current ones.
+
+    Args:
+        conn: DuckDB connection
+
+    Returns:
+        Latest cube refresh time, or None without refresh state
+    """
+    # Checked through the catalog first, as a failing query would abort an
+    # open transaction on the caller's connection
+    exists = conn.execute(
+        "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = 'cube_refresh_state'"
+    ).fetchone()[0]
+    if not exists:
+        return None
+
+    return conn.execute("SELECT MAX(refreshed_at) FROM cube_refresh_state").fetchone()[0]
+
+
+def _cached_query(method: _QueryMethod) -> _QueryMethod:
+    """Cache a query method's result by connection and arguments.
+
+    Entries are only reused while the connection's data version (see
+    _data_version) is unchanged. They also expire after _CACHE_TTL_SECONDS,
+    and the least recently used entry of a connection is evicted beyond
+    _CACHE_MAXSIZE. Cached DataFrames are returned as shallow copies so
+    callers can add or rename columns without affecting the cache.
+
+    Args:
+        method: OLAPQueries method taking the connection as first argument
+
+    Returns:
+        Wrapped method
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, conn: duckdb.DuckDBPyConnection, *args, **kwargs):
+        # Streamed results can only be consumed once
+        if kwargs.get("stream"):
+            return method(self, conn, *args, **kwargs)
+
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        version = _data_version(conn)
+        now = time.monotonic()
+
+        with _cache_lock:
+            entries = _cache.get(conn)
+            entry = entries.get(key) if entries is not None else None
+            if entry is not None and entry[0] > now and entry[1] == version:
+                entries.move_to_end(key)
+                result = entry[2]
+            else:
+                result = None
+
+        if result is None:
+            result = method(self, conn, *args, **kwargs)
+            with _cache_lock:
+                entries = _cache.setdefault(conn, OrderedDict())
+                entries[key] = (now + _CACHE_TTL_SECONDS, version, result)
+                entries.move_to_end(key)
+                while len(entries) > _CACHE_MAXSIZE:
+                    entries.popitem(last=False)
+
+        if isinstance(result, pd.DataFrame):
+            return result.copy(deep=False)
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+# Stand-in lower bound so the magnitude filter can stay in the SQL text
+# (and be bound as a parameter) when no minimum is requested
+_NO_MIN_MAGNITUDE = float("-inf")
+
+# Magnitude groups of dim_magnitude at or above each group's lower bound;
+# filters on these thresholds can be answered from cube_moon_phase
+_MOON_CUBE_GROUPS = {
+    _NO_MIN_MAGNITUDE: ("1-3", "4", "5", "6-7", "8-9"),
+    4.0: ("4", "5", "6-7", "8-9"),
+    5.0: ("5", "6-7", "8-9"),
+    6.0: ("6-7", "8-9"),
+    8.0: ("8-9",),
+}
+
+
 class OLAPQueries(LoggerMixin):
     """Execute pre-defined analytical queries on the OLAP system."""
 
@@ -20,22 +144,104 @@ class OLAPQueries(LoggerMixin):
         """
         self.config = config or get_config()
 
+    @staticmethod
+    def _fetch(
+        conn: duckdb.DuckDBPyConnection,
+        sql: str,
+        params: Optional[Sequence[Any]] = None,
+        as_arrow: bool = False,
+    ) -> Union[pd.DataFrame, "pa.Table"]:
+        """Execute a query and fetch the full result.
+
+        Args:
+            conn: DuckDB connection
+            sql: Query to execute
+            params: Values bound to the query's placeholders
+            as_arrow: Return a pyarrow Table instead of a pandas DataFrame,
+                skipping the conversion to pandas
+
+        Returns:
+            Query result as a DataFrame or Arrow table
+        """
+        result = conn.execute(sql, params or [])
+        return result.fetch_arrow_table() if as_arrow else result.df()
+
+    @staticmethod
+    def _coerce_limit(limit: Optional[int], default: int = 10, max_: int = 100_000) -> int:
+        """Normalize a row limit to a non-negative int no larger than max_.
+
+        Args:
+            limit: Requested number of rows, or None for the default
+            default: Limit used when none is given
+            max_: Upper bound the limit is clamped to
+
+        Returns:
+            The limit as an int
+
+        Raises:
+            ValueError: If the limit is not an integer or is negative
+        """
+        if limit is None:
+            return default
+        if isinstance(limit, bool) or int(limit) != limit:
+            raise ValueError(f"Limit must be an integer, got {limit!r}")
+        if limit < 0:
+            raise ValueError(f"Limit must not be negative, got {limit}")
+        return min(int(limit), max_)
+
+    @staticmethod
+    def _coerce_min_magnitude(min_magnitude: Optional[float]) -> float:
+        """Resolve an optional magnitude filter to a bindable lower bound.
+
+        Args:
+            min_magnitude: Minimum magnitude filter, or None for no filter
+
+        Returns:
+            The filter value as a float, or negative infinity when no filter
+            is given
+
+        Raises:
+            ValueError: If the filter is NaN
+        """
+        if min_magnitude is None:
+            return _NO_MIN_MAGNITUDE
+        value = float(min_magnitude)
+        if math.isnan(value):
+            raise ValueError("Minimum magnitude must be a number, got NaN")
+        return value
+
+    @_cached_query
     def get_top_magnitude_events(
-        self, conn: duckdb.DuckDBPyConnection, limit: int = 10
-    ) -> pd.DataFrame:
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        limit: int = 10,
+        as_arrow: bool = False,
+    ) -> Union[pd.DataFrame, "pa.Table"]:
         """Get top magnitude earthquake events.
 
         Args:
             conn: DuckDB connection
             limit: Number of results to return
+            as_arrow: Return a pyarrow Table instead of a pandas DataFrame
 
         Returns:
-            DataFrame with top events
+            DataFrame or Arrow table with top events
         """
-        sql = f"""
+        limit = self._coerce_limit(limit, default=10)
+
+        if limit <= TOP_EVENTS_ROWS:
+            sql = """
+            SELECT *
+            FROM top_magnitude_events
+            ORDER BY magnitude DESC
+            LIMIT ?
+            """
+            return self._fetch(conn, sql, [limit], as_arrow=as_arrow)
+
+        sql = """
         SELECT
             f.event_id,
-            t.datetime,
+            f.event_time AS datetime,
             l.place,
             l.region,
             m.magnitude,
@@ -45,28 +251,34 @@ class OLAPQueries(LoggerMixin):
             l.latitude,
             l.longitude
         FROM fact_earthquakes f
-        JOIN dim_time t ON f.time_id = t.time_id
         JOIN dim_location l ON f.location_id = l.location_id
         JOIN dim_magnitude m ON f.magnitude_id = m.magnitude_id
         ORDER BY m.magnitude DESC
-        LIMIT {limit}
+        LIMIT ?
         """
 
-        return conn.execute(sql).df()
+        return self._fetch(conn, sql, [limit], as_arrow=as_arrow)
 
+    @_cached_query
     def get_events_by_region(
-        self, conn: duckdb.DuckDBPyConnection, top_n: int = 10
-    ) -> pd.DataFrame:
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        top_n: int = 10,
+        as_arrow: bool = False,
+    ) -> Union[pd.DataFrame, "pa.Table"]:
         """Get earthquake count by region.
 
         Args:
             conn: DuckDB connection
             top_n: Number of top regions to return
+            as_arrow: Return a pyarrow Table instead of a pandas DataFrame
 
         Returns:
-            DataFrame with regional statistics
+            DataFrame or Arrow table with regional statistics
         """
-        sql = f"""
+        top_n = self._coerce_limit(top_n, default=10)
+
+        sql = """
         SELECT
             region,
             event_count,
@@ -74,23 +286,27 @@ class OLAPQueries(LoggerMixin):
             max_magnitude,
             center_latitude,
             center_longitude
-        FROM cube_location_magnitude
-        GROUP BY region, event_count, avg_magnitude, max_magnitude, 
-                 center_latitude, center_longitude
+        FROM cube_region_rollup
         ORDER BY event_count DESC
-        LIMIT {top_n}
+        LIMIT ?
         """
 
-        return conn.execute(sql).df()
+        return self._fetch(conn, sql, [top_n], as_arrow=as_arrow)
 
-    def get_temporal_trends(self, conn: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+    @_cached_query
+    def get_temporal_trends(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        as_arrow: bool = False,
+    ) -> Union[pd.DataFrame, "pa.Table"]:
         """Get temporal trends of earthquake activity.
 
         Args:
             conn: DuckDB connection
+            as_arrow: Return a pyarrow Table instead of a pandas DataFrame
 
         Returns:
-            DataFrame with temporal trends
+            DataFrame or Arrow table with temporal trends
         """
         sql = """
         SELECT
@@ -104,74 +320,83 @@ class OLAPQueries(LoggerMixin):
         ORDER BY date
         """
 
-        return conn.execute(sql).df()
+        return self._fetch(conn, sql, as_arrow=as_arrow)
 
-    def get_magnitude_distribution(self, conn: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+    @_cached_query
+    def get_magnitude_distribution(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        as_arrow: bool = False,
+    ) -> Union[pd.DataFrame, "pa.Table"]:
         """Get distribution of earthquakes by magnitude category.
 
         Args:
             conn: DuckDB connection
+            as_arrow: Return a pyarrow Table instead of a pandas DataFrame
 
         Returns:
-            DataFrame with magnitude distribution
+            DataFrame or Arrow table with magnitude distribution
         """
         sql = """
         SELECT
-            magnitude_category,
-            SUM(event_count) AS total_events,
-            AVG(avg_magnitude) AS avg_magnitude,
-            AVG(avg_depth) AS avg_depth
-        FROM cube_time_magnitude
-        GROUP BY magnitude_category
-        ORDER BY 
-            CASE magnitude_category
-                WHEN 'Minor' THEN 1
-                WHEN 'Light' THEN 2
-                WHEN 'Moderate' THEN 3
-                WHEN 'Strong' THEN 4
-                WHEN 'Major' THEN 5
-                WHEN 'Great' THEN 6
-            END
+            c.magnitude_category,
+            SUM(c.event_count) AS total_events,
+            AVG(c.avg_magnitude) AS avg_magnitude,
+            AVG(c.avg_depth) AS avg_depth
+        FROM cube_time_magnitude c
+        LEFT JOIN dim_category_order o
+            ON o.category_type = 'magnitude' AND o.category = c.magnitude_category
+        GROUP BY c.magnitude_category, o.sort_key
+        ORDER BY o.sort_key
         """
 
-        return conn.execute(sql).df()
+        return self._fetch(conn, sql, as_arrow=as_arrow)
 
-    def get_depth_analysis(self, conn: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+    @_cached_query
+    def get_depth_analysis(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        as_arrow: bool = False,
+    ) -> Union[pd.DataFrame, "pa.Table"]:
         """Get analysis of earthquakes by depth category.
 
         Args:
             conn: DuckDB connection
+            as_arrow: Return a pyarrow Table instead of a pandas DataFrame
 
         Returns:
-            DataFrame with depth analysis
+            DataFrame or Arrow table with depth analysis
         """
         sql = """
         SELECT
-            depth_category,
-            SUM(event_count) AS total_events,
-            AVG(avg_depth) AS avg_depth,
-            AVG(avg_magnitude) AS avg_magnitude,
-            AVG(avg_stations) AS avg_stations
-        FROM cube_depth_analysis
-        GROUP BY depth_category
-        ORDER BY 
-            CASE depth_category
-                WHEN 'Shallow' THEN 1
-                WHEN 'Intermediate' THEN 2
-                WHEN 'Deep' THEN 3
-            END
+            c.depth_category,
+            SUM(c.event_count) AS total_events,
+            AVG(c.avg_depth) AS avg_depth,
+            AVG(c.avg_magnitude) AS avg_magnitude,
+            AVG(c.avg_stations) AS avg_stations
+        FROM cube_depth_analysis c
+        LEFT JOIN dim_category_order o
+            ON o.category_type = 'depth' AND o.category = c.depth_category
+        GROUP BY c.depth_category, o.sort_key
+        ORDER BY o.sort_key
         """
 
-        return conn.execute(sql).df()
+        return self._fetch(conn, sql, as_arrow=as_arrow)
 
-    def get_hourly_patterns(self, conn: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+    @_cached_query
+    def get_hourly_patterns(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        as_arrow: bool = False,
+    ) -> Union[pd.DataFrame, "pa.Table"]:
         """Get earthquake patterns by hour of day.
 
         Args:
             conn: DuckDB connection
+            as_arrow: Return a pyarrow Table instead of a pandas DataFrame
 
         Returns:
-            DataFrame with hourly patterns
+            DataFrame or Arrow table with hourly patterns
         """
         sql = """
         SELECT
@@ -183,132 +408,202 @@ class OLAPQueries(LoggerMixin):
         ORDER BY hour
         """
 
-        return conn.execute(sql).df()
+        return self._fetch(conn, sql, as_arrow=as_arrow)
 
-    def get_seasonal_patterns(self, conn: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+    @_cached_query
+    def get_seasonal_patterns(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        as_arrow: bool = False,
+    ) -> Union[pd.DataFrame, "pa.Table"]:
         """Get earthquake patterns by season.
 
         Args:
             conn: DuckDB connection
+            as_arrow: Return a pyarrow Table instead of a pandas DataFrame
 
         Returns:
-            DataFrame with seasonal patterns
+            DataFrame or Arrow table with seasonal patterns
         """
         sql = """
         SELECT
-            season,
-            SUM(event_count) AS total_events,
-            AVG(avg_magnitude) AS avg_magnitude,
-            AVG(avg_depth) AS avg_depth
-        FROM cube_time_magnitude
-        GROUP BY season
-        ORDER BY 
-            CASE season
-                WHEN 'Spring' THEN 1
-                WHEN 'Summer' THEN 2
-                WHEN 'Fall' THEN 3
-                WHEN 'Winter' THEN 4
-            END
+            c.season,
+            SUM(c.event_count) AS total_events,
+            AVG(c.avg_magnitude) AS avg_magnitude,
+            AVG(c.avg_depth) AS avg_depth
+        FROM cube_time_magnitude c
+        LEFT JOIN dim_category_order o
+            ON o.category_type = 'season' AND o.category = c.season
+        GROUP BY c.season, o.sort_key
+        ORDER BY o.sort_key
         """
 
-        return conn.execute(sql).df()
+        return self._fetch(conn, sql, as_arrow=as_arrow)
 
+    @_cached_query
     def get_moon_phase_analysis(
-        self, conn: duckdb.DuckDBPyConnection, min_magnitude: Optional[float] = None
-    ) -> pd.DataFrame:
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        min_magnitude: Optional[float] = None,
+        as_arrow: bool = False,
+    ) -> Union[pd.DataFrame, "pa.Table"]:
         """Get earthquake distribution by moon phase and magnitude group.
 
         Args:
             conn: DuckDB connection
             min_magnitude: Minimum magnitude filter
+            as_arrow: Return a pyarrow Table instead of a pandas DataFrame
 
         Returns:
-            DataFrame with moon phase analysis
+            DataFrame or Arrow table with moon phase analysis
         """
-        where_clause = ""
-        if min_magnitude is not None:
-            where_clause = f"WHERE avg_magnitude >= {min_magnitude}"
+        min_magnitude = self._coerce_min_magnitude(min_magnitude)
 
-        sql = f"""
+        sql = """
         SELECT
-            moon_phase_name,
-            moon_phase,
-            magnitude_group,
-            event_count,
-            avg_magnitude,
-            max_magnitude,
-            avg_depth
-        FROM cube_moon_phase
-        {where_clause}
-        ORDER BY moon_phase, magnitude_group
+            p.moon_phase_name,
+            p.phase_bucket AS moon_phase,
+            c.magnitude_group,
+            c.event_count,
+            c.avg_magnitude,
+            c.max_magnitude,
+            c.avg_depth
+        FROM cube_moon_phase c
+        LEFT JOIN dim_moon_phase p ON p.moon_phase_id = c.moon_phase_id
+        WHERE c.avg_magnitude >= ?
+        ORDER BY c.moon_phase_id, c.magnitude_group
         """
 
-        return conn.execute(sql).df()
+        return self._fetch(conn, sql, [min_magnitude], as_arrow=as_arrow)
 
+    @_cached_query
     def get_moon_phase_filtered(
-        self, conn: duckdb.DuckDBPyConnection, min_magnitude: Optional[float] = None
-    ) -> pd.DataFrame:
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        min_magnitude: Optional[float] = None,
+        as_arrow: bool = False,
+    ) -> Union[pd.DataFrame, "pa.Table"]:
         """Get earthquake distribution by moon phase with magnitude filter applied.
 
         Args:
             conn: DuckDB connection
             min_magnitude: Minimum magnitude filter
+            as_arrow: Return a pyarrow Table instead of a pandas DataFrame
 
         Returns:
-            DataFrame with moon phase analysis (filtered)
+            DataFrame or Arrow table with moon phase analysis (filtered)
         """
-        where_clause = ""
-        if min_magnitude is not None:
-            where_clause = f"WHERE m.magnitude >= {min_magnitude}"
+        min_magnitude = self._coerce_min_magnitude(min_magnitude)
+
+        groups = _MOON_CUBE_GROUPS.get(min_magnitude)
+        if groups is not None:
+            return self._moon_phase_from_cube(conn, groups, as_arrow=as_arrow)
 
-        sql = f"""
+        # Filter the magnitude dimension before the join so the hash table
+        # built from it only holds qualifying magnitudes
+        sql = """
+        WITH m_filt AS (
+            SELECT magnitude_id, magnitude, magnitude_group
+            FROM dim_magnitude
+            WHERE magnitude >= ?
+        )
         SELECT
-            f.moon_phase_name,
-            f.moon_phase,
-            CASE 
-                WHEN m.magnitude < 4.0 THEN '1-3'
-                WHEN m.magnitude >= 4.0 AND m.magnitude < 5.0 THEN '4'
-                WHEN m.magnitude >= 5.0 AND m.magnitude < 6.0 THEN '5'
-                WHEN m.magnitude >= 6.0 AND m.magnitude < 8.0 THEN '6-7'
-                ELSE '8-9'
-            END AS magnitude_group,
-            COUNT(*) AS event_count,
-            AVG(m.magnitude) AS avg_magnitude,
-            MAX(m.magnitude) AS max_magnitude,
-            AVG(f.depth) AS avg_depth
-        FROM fact_earthquakes f
-        JOIN dim_magnitude m ON f.magnitude_id = m.magnitude_id
-        {where_clause}
-        GROUP BY f.moon_phase_name, f.moon_phase, magnitude_group
-        ORDER BY f.moon_phase, magnitude_group
+            p.moon_phase_name,
+            p.phase_bucket AS moon_phase,
+            g.magnitude_group,
+            g.event_count,
+            g.avg_magnitude,
+            g.max_magnitude,
+            g.avg_depth
+        FROM (
+            SELECT
+                f.moon_phase_id,
+                m.magnitude_group,
+                COUNT(*) AS event_count,
+                AVG(m.magnitude) AS avg_magnitude,
+                MAX(m.magnitude) AS max_magnitude,
+                AVG(f.depth) AS avg_depth
+            FROM fact_earthquakes f
+            JOIN m_filt m ON f.magnitude_id = m.magnitude_id
+            GROUP BY f.moon_phase_id, m.magnitude_group
+        ) g
+        LEFT JOIN dim_moon_phase p ON p.moon_phase_id = g.moon_phase_id
+        ORDER BY g.moon_phase_id, g.magnitude_group
+        """
+
+        return self._fetch(conn, sql, [min_magnitude], as_arrow=as_arrow)
+
+    def _moon_phase_from_cube(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        groups: Sequence[str],
+        as_arrow: bool = False,
+    ) -> Union[pd.DataFrame, "pa.Table"]:
+        """Read moon phase statistics for whole magnitude groups from the cube.
+
+        Args:
+            conn: DuckDB connection
+            groups: Magnitude groups to include
+            as_arrow: Return a pyarrow Table instead of a pandas DataFrame
+
+        Returns:
+            DataFrame or Arrow table with moon phase analysis
+        """
+        sql = """
+        SELECT
+            p.moon_phase_name,
+            p.phase_bucket AS moon_phase,
+            c.magnitude_group,
+            c.event_count,
+            c.avg_magnitude,
+            c.max_magnitude,
+            c.avg_depth
+        FROM cube_moon_phase c
+        LEFT JOIN dim_moon_phase p ON p.moon_phase_id = c.moon_phase_id
+        WHERE list_contains(?::VARCHAR[], c.magnitude_group)
+        ORDER BY c.moon_phase_id, c.magnitude_group
         """
 
-        return conn.execute(sql).df()
+        return self._fetch(conn, sql, [list(groups)], as_arrow=as_arrow)
 
+    @_cached_query
     def get_events_for_map(
-        self, 
+        self,
         conn: duckdb.DuckDBPyConnection,
         min_magnitude: Optional[float] = None,
-        limit: int = 1000
-    ) -> pd.DataFrame:
+        limit: int = 1000,
+        as_arrow: bool = False,
+        *,
+        stream: bool = False,
+    ) -> Union[pd.DataFrame, "pa.Table", "pa.RecordBatchReader"]:
         """Get earthquake events formatted for map visualization.
 
         Args:
             conn: DuckDB connection
             min_magnitude: Minimum magnitude filter
             limit: Maximum number of events to return
+            as_arrow: Return a pyarrow Table instead of a pandas DataFrame
+            stream: Return a pyarrow RecordBatchReader yielding batches of
+                MAP_STREAM_BATCH_ROWS rows instead of materializing the result
 
         Returns:
-            DataFrame with map-ready data
+            DataFrame or Arrow table with map-ready data, or a batch reader
+            when streaming
         """
-        where_clause = ""
-        if min_magnitude is not None:
-            where_clause = f"WHERE m.magnitude >= {min_magnitude}"
+        min_magnitude = self._coerce_min_magnitude(min_magnitude)
+        limit = self._coerce_limit(limit, default=1000)
 
-        sql = f"""
+        # Join the pre-filtered magnitude dimension first so the location
+        # join only sees qualifying facts
+        sql = """
+        WITH m_filt AS (
+            SELECT magnitude_id, magnitude, magnitude_category
+            FROM dim_magnitude
+            WHERE magnitude >= ?
+        )
         SELECT
             f.event_id,
-            t.datetime,
+            f.event_time AS datetime,
             l.latitude,
             l.longitude,
             l.place,
@@ -318,12 +613,18 @@ class OLAPQueries(LoggerMixin):
             f.depth,
             f.depth_category
         FROM fact_earthquakes f
-        JOIN dim_time t ON f.time_id = t.time_id
+        JOIN m_filt m ON f.magnitude_id = m.magnitude_id
         JOIN dim_location l ON f.location_id = l.location_id
-        JOIN dim_magnitude m ON f.magnitude_id = m.magnitude_id
-        {where_clause}
-        ORDER BY m.magnitude DESC, t.datetime DESC
-        LIMIT {limit}
+        ORDER BY m.magnitude DESC, f.event_time DESC
+        LIMIT ?
         """
 
-        return conn.execute(sql).df()
+        params = [min_magnitude, limit]
+
+        if stream:
+            # A dedicated cursor keeps the stream valid while the connection
+            # runs other queries
+            cursor = conn.cursor()
+            return cursor.execute(sql, params).fetch_record_batch(MAP_STREAM_BATCH_ROWS)
+
+        return self._fetch(conn, sql, params, as_arrow=as_arrow)
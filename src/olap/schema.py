@@ -1,6 +1,9 @@
 """OLAP schema definition for earthquake data warehouse."""
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
 
 import duckdb
 
@@ -29,29 +32,177 @@ class OLAPSchema(LoggerMixin):
         self.logger.info("Creating OLAP star schema")
         print_info("Creating star schema for OLAP analytics...")
 
-        # Create dimensions
-        self._create_dim_time(conn)
-        self._create_dim_location(conn)
-        self._create_dim_magnitude(conn)
+        # Unordered inserts let the bulk builds write in parallel; the fact
+        # build re-enables ordering only for its clustered CTAS
+        conn.execute("SET preserve_insertion_order=false")
+        try:
+            self._create_raw_valid(conn)
 
-        # Create fact table
-        self._create_fact_earthquakes(conn)
+            try:
+                # Create dimensions. These commit on their own cursors, so they
+                # stay outside the transaction below
+                self._create_dimensions(conn)
+                self._create_dimension_indexes(conn)
+
+                # Lookup tables and the fact table are written in one
+                # transaction, which also lets the fact CTAS write optimistically
+                conn.begin()
+                try:
+                    self._create_dim_category_order(conn)
+                    self._create_dim_moon_phase(conn)
+                    self._create_fact_earthquakes(conn)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+            finally:
+                conn.execute("DROP TABLE IF EXISTS raw_valid")
+        finally:
+            conn.execute(
+                f"SET preserve_insertion_order={str(self.config.duckdb.preserve_insertion_order).lower()}"
+            )
+
+        self._log_sizes(
+            conn,
+            [
+                self.schema_config.get("dim_time", "dim_time"),
+                self.schema_config.get("dim_location", "dim_location"),
+                self.schema_config.get("dim_magnitude", "dim_magnitude"),
+                self.schema_config.get("fact_table", "fact_earthquakes"),
+            ],
+        )
 
         print_success("Star schema created successfully")
 
-    def _create_dim_time(self, conn: duckdb.DuckDBPyConnection) -> None:
-        """Create time dimension table.
+    def _create_raw_valid(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Materialize the raw rows the star schema is built from.
+
+        The validity filter is applied once here, and the dimensions and the
+        fact table all read the result instead of filtering raw_earthquakes
+        themselves. NULL-filled copies of the text natural-key columns are
+        added as place_clean, region_clean and magnitude_type_clean, so the
+        builds do not repeat the COALESCE. It is a regular table rather than a
+        temporary one so the concurrent dimension builders can see it from
+        their own cursors.
+
+        Args:
+            conn: DuckDB connection
+        """
+        self.logger.info("Materializing raw_valid")
+
+        conn.execute("""
+        CREATE OR REPLACE TABLE raw_valid AS
+        SELECT
+            *,
+            COALESCE(place, 'Unknown') AS place_clean,
+            COALESCE(region, 'Unknown') AS region_clean,
+            COALESCE(magnitude_type, 'Unknown') AS magnitude_type_clean
+        FROM raw_earthquakes
+        WHERE datetime IS NOT NULL
+            AND latitude IS NOT NULL
+            AND longitude IS NOT NULL
+            AND magnitude IS NOT NULL
+        """)
+
+    def _create_dimensions(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Create time, location and magnitude dimensions from raw_valid.
+
+        The three dimensions are independent, so they are built concurrently,
+        each on its own cursor.
+
+        Args:
+            conn: DuckDB connection
+        """
+        builders = [
+            partial(self._create_dim_time, source="raw_valid"),
+            partial(self._create_dim_location, source="raw_valid"),
+            partial(self._create_dim_magnitude, source="raw_valid"),
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(builders)) as executor:
+            futures = [
+                executor.submit(self._run_on_cursor, conn, builder) for builder in builders
+            ]
+            for future in futures:
+                future.result()
+
+    @staticmethod
+    def _run_on_cursor(
+        conn: duckdb.DuckDBPyConnection,
+        builder: Callable[[duckdb.DuckDBPyConnection], None],
+    ) -> None:
+        """Run a table builder on a dedicated cursor of the shared database.
+
+        Args:
+            conn: DuckDB connection
+            builder: Table creation method
+        """
+        cursor = conn.cursor()
+        try:
+            builder(cursor)
+        finally:
+            cursor.close()
+
+    def _log_sizes(self, conn: duckdb.DuckDBPyConnection, tables: List[str]) -> None:
+        """Log the row counts of several tables from the catalog.
+
+        Args:
+            conn: DuckDB connection
+            tables: Names of tables to report
+        """
+        row_counts = self._table_row_counts(conn, tables)
+        for table in tables:
+            if table in row_counts:
+                self.logger.info(f"{table} has {row_counts[table]:,} records")
+
+    def _create_dimension_indexes(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Create ART indexes on the columns facts are matched to dimensions by.
 
         Args:
             conn: DuckDB connection
         """
+        dim_time = self.schema_config.get("dim_time", "dim_time")
+        dim_location = self.schema_config.get("dim_location", "dim_location")
+        dim_magnitude = self.schema_config.get("dim_magnitude", "dim_magnitude")
+
+        indexes = [
+            (dim_time, "datetime"),
+            (dim_location, "location_key"),
+            (dim_magnitude, "magnitude_key"),
+        ]
+
+        for table, column in indexes:
+            try:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{table}_natkey ON {table} ({column})"
+                )
+                self.logger.info(f"Created index idx_{table}_natkey on {table}({column})")
+            except Exception as e:
+                self.logger.warning(f"Could not create index on {table}({column}): {e}")
+
+    def _create_dim_time(
+        self, conn: duckdb.DuckDBPyConnection, source: str = "raw_earthquakes"
+    ) -> None:
+        """Create time dimension as an hourly calendar.
+
+        Rows are generated for every hour of the covered years rather than
+        mined from observed event times; facts join on their event time
+        truncated to the hour.
+
+        Args:
+            conn: DuckDB connection
+            source: Table whose year column extends the configured year span
+        """
         self.logger.info("Creating dim_time")
 
         dim_time_table = self.schema_config.get("dim_time", "dim_time")
+        first_year, last_year = self._calendar_years(conn, source)
 
+        # time_id must follow event time: incremental cube refreshes use it
+        # as the watermark for facts already aggregated
         sql = f"""
         CREATE OR REPLACE TABLE {dim_time_table} AS
-        SELECT DISTINCT
+        SELECT
             ROW_NUMBER() OVER (ORDER BY datetime) AS time_id,
             datetime,
             DATE_TRUNC('day', datetime) AS date,
@@ -60,43 +211,71 @@ class OLAPSchema(LoggerMixin):
             day,
             hour,
             day_of_week,
-            CASE day_of_week
-                WHEN 1 THEN 'Monday'
-                WHEN 2 THEN 'Tuesday'
-                WHEN 3 THEN 'Wednesday'
-                WHEN 4 THEN 'Thursday'
-                WHEN 5 THEN 'Friday'
-                WHEN 6 THEN 'Saturday'
-                WHEN 7 THEN 'Sunday'
-            END AS day_name,
-            CASE 
-                WHEN month IN (12, 1, 2) THEN 'Winter'
-                WHEN month IN (3, 4, 5) THEN 'Spring'
-                WHEN month IN (6, 7, 8) THEN 'Summer'
-                ELSE 'Fall'
-            END AS season,
+            -- Name lookups index a list instead of walking a CASE per row
+            [
+                'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'
+            ][day_of_week] AS day_name,
+            [
+                'Winter', 'Winter', 'Spring', 'Spring', 'Spring', 'Summer',
+                'Summer', 'Summer', 'Fall', 'Fall', 'Fall', 'Winter'
+            ][month] AS season,
             CASE 
                 WHEN day_of_week IN (6, 7) THEN true
                 ELSE false
             END AS is_weekend
         FROM (
-            SELECT DISTINCT datetime, year, month, day, hour, day_of_week
-            FROM raw_earthquakes
-            WHERE datetime IS NOT NULL
+            SELECT
+                ts AS datetime,
+                CAST(year(ts) AS INTEGER) AS year,
+                CAST(month(ts) AS TINYINT) AS month,
+                CAST(day(ts) AS TINYINT) AS day,
+                CAST(hour(ts) AS TINYINT) AS hour,
+                CAST(isodow(ts) AS TINYINT) AS day_of_week
+            FROM generate_series(
+                TIMESTAMP '{first_year:04d}-01-01 00:00:00',
+                TIMESTAMP '{last_year:04d}-12-31 23:00:00',
+                INTERVAL 1 HOUR
+            ) AS calendar(ts)
         )
-        ORDER BY datetime
         """
 
         conn.execute(sql)
-        result = conn.execute(f"SELECT COUNT(*) FROM {dim_time_table}").fetchone()
-        count = result[0] if result else 0
-        self.logger.info(f"Created {dim_time_table} with {count:,} records")
+        self.logger.info(f"Created {dim_time_table} for {first_year}-{last_year}")
+
+    def _calendar_years(self, conn: duckdb.DuckDBPyConnection, source: str) -> Tuple[int, int]:
+        """Determine the span of years the time dimension must cover.
+
+        The configured years are widened to the years present in the source,
+        so no event falls outside the calendar.
+
+        Args:
+            conn: DuckDB connection
+            source: Table with a year column
+
+        Returns:
+            First and last year to generate
+        """
+        data_source = self.config.data_source
+        years = list(data_source.years_to_load or [])
+        years += [y for y in (data_source.start_year, data_source.end_year) if y is not None]
+
+        result = conn.execute(f"SELECT MIN(year), MAX(year) FROM {source}").fetchone()
+        if result:
+            years += [int(y) for y in result if y is not None]
 
-    def _create_dim_location(self, conn: duckdb.DuckDBPyConnection) -> None:
+        if not years:
+            years = [datetime.now().year]
+
+        return min(years), max(years)
+
+    def _create_dim_location(
+        self, conn: duckdb.DuckDBPyConnection, source: str = "raw_earthquakes"
+    ) -> None:
         """Create location dimension table.
 
         Args:
             conn: DuckDB connection
+            source: Table the distinct locations are read from
         """
         self.logger.info("Creating dim_location")
 
@@ -104,12 +283,15 @@ class OLAPSchema(LoggerMixin):
 
         sql = f"""
         CREATE OR REPLACE TABLE {dim_location_table} AS
-        SELECT DISTINCT
+        SELECT
+            -- Ordered on the natural key so ids are stable across rebuilds
             ROW_NUMBER() OVER (ORDER BY latitude, longitude, place, region) AS location_id,
             latitude,
             longitude,
             place,
             region,
+            -- Single-column key the fact build joins on
+            hash(latitude, longitude, place, region) AS location_key,
             -- Hemisphere classification
             CASE 
                 WHEN latitude >= 0 THEN 'Northern'
@@ -126,26 +308,28 @@ class OLAPSchema(LoggerMixin):
                 ELSE 'Polar'
             END AS climate_zone
         FROM (
-            SELECT DISTINCT 
-                latitude, 
-                longitude, 
-                COALESCE(place, 'Unknown') as place,
-                COALESCE(region, 'Unknown') as region
-            FROM raw_earthquakes
+            SELECT
+                latitude,
+                longitude,
+                place_clean AS place,
+                region_clean AS region
+            FROM {source}
             WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+            GROUP BY ALL
         )
         """
 
         conn.execute(sql)
-        result = conn.execute(f"SELECT COUNT(*) FROM {dim_location_table}").fetchone()
-        count = result[0] if result else 0
-        self.logger.info(f"Created {dim_location_table} with {count:,} records")
+        self.logger.info(f"Created {dim_location_table}")
 
-    def _create_dim_magnitude(self, conn: duckdb.DuckDBPyConnection) -> None:
+    def _create_dim_magnitude(
+        self, conn: duckdb.DuckDBPyConnection, source: str = "raw_earthquakes"
+    ) -> None:
         """Create magnitude dimension table.
 
         Args:
             conn: DuckDB connection
+            source: Table the distinct magnitudes are read from
         """
         self.logger.info("Creating dim_magnitude")
 
@@ -153,44 +337,123 @@ class OLAPSchema(LoggerMixin):
 
         sql = f"""
         CREATE OR REPLACE TABLE {dim_magnitude_table} AS
-        SELECT DISTINCT
-            ROW_NUMBER() OVER (ORDER BY magnitude, magnitude_type, magnitude_category) AS magnitude_id,
+        SELECT
+            -- Ordered on the natural key so ids are stable across rebuilds
+            ROW_NUMBER() OVER (
+                ORDER BY magnitude, magnitude_type, magnitude_category
+            ) AS magnitude_id,
             magnitude,
             magnitude_category,
             magnitude_type,
-            -- Richter scale effects description
-            CASE 
-                WHEN magnitude < 2.0 THEN 'Micro - Not felt'
-                WHEN magnitude < 3.0 THEN 'Minor - Rarely felt'
-                WHEN magnitude < 4.0 THEN 'Light - Often felt, rarely causes damage'
-                WHEN magnitude < 5.0 THEN 'Moderate - Notable shaking, slight damage'
-                WHEN magnitude < 6.0 THEN 'Strong - Can cause damage in populated areas'
-                WHEN magnitude < 7.0 THEN 'Major - Serious damage over large areas'
-                WHEN magnitude < 8.0 THEN 'Great - Serious damage over very large areas'
-                ELSE 'Epic - Devastating over extremely large areas'
-            END AS effects_description,
-            -- Energy release (approximate, in joules)
-            POWER(10, (1.5 * magnitude + 4.8)) AS energy_joules
+            -- Single-column key the fact build joins on
+            hash(magnitude, magnitude_type, magnitude_category) AS magnitude_key,
+            -- Richter scale effects description, indexed by whole magnitude
+            -- (below 2 is Micro, 8 and above is Epic)
+            [
+                'Micro - Not felt',
+                'Minor - Rarely felt',
+                'Light - Often felt, rarely causes damage',
+                'Moderate - Notable shaking, slight damage',
+                'Strong - Can cause damage in populated areas',
+                'Major - Serious damage over large areas',
+                'Great - Serious damage over very large areas',
+                'Epic - Devastating over extremely large areas'
+            ][LEAST(GREATEST(CAST(FLOOR(magnitude) AS INTEGER), 1), 8)] AS effects_description,
+            -- Magnitude bands used by the moon phase analysis
+            ['1-3', '4', '5', '6-7', '6-7', '8-9'][
+                LEAST(GREATEST(CAST(FLOOR(magnitude) AS INTEGER) - 2, 1), 6)
+            ] AS magnitude_group,
+            -- Energy release (approximate, in joules); 10^x as exp(x * ln 10)
+            EXP(2.302585092994046 * (1.5 * magnitude + 4.8)) AS energy_joules
         FROM (
-            SELECT DISTINCT 
+            SELECT
                 magnitude,
-                COALESCE(magnitude_type, 'Unknown') as magnitude_type,
+                magnitude_type_clean AS magnitude_type,
                 magnitude_category
-            FROM raw_earthquakes
+            FROM {source}
             WHERE magnitude IS NOT NULL
+            GROUP BY ALL
         )
         """
 
         conn.execute(sql)
-        result = conn.execute(f"SELECT COUNT(*) FROM {dim_magnitude_table}").fetchone()
-        count = result[0] if result else 0
-        self.logger.info(f"Created {dim_magnitude_table} with {count:,} records")
+        self.logger.info(f"Created {dim_magnitude_table}")
+
+    def _create_dim_category_order(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Create lookup table with the display order of categorical attributes.
+
+        Args:
+            conn: DuckDB connection
+        """
+        self.logger.info("Creating dim_category_order")
+
+        dim_category_order_table = self.schema_config.get(
+            "dim_category_order", "dim_category_order"
+        )
+
+        sql = f"""
+        CREATE OR REPLACE TABLE {dim_category_order_table} AS
+        SELECT * FROM (VALUES
+            ('magnitude', 'Minor', 1),
+            ('magnitude', 'Light', 2),
+            ('magnitude', 'Moderate', 3),
+            ('magnitude', 'Strong', 4),
+            ('magnitude', 'Major', 5),
+            ('magnitude', 'Great', 6),
+            ('depth', 'Shallow', 1),
+            ('depth', 'Intermediate', 2),
+            ('depth', 'Deep', 3),
+            ('season', 'Spring', 1),
+            ('season', 'Summer', 2),
+            ('season', 'Fall', 3),
+            ('season', 'Winter', 4)
+        ) AS t(category_type, category, sort_key)
+        """
+
+        conn.execute(sql)
+        self.logger.info(f"Created {dim_category_order_table}")
+
+    def _create_dim_moon_phase(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Create moon phase dimension with integer keys in lunar cycle order.
+
+        Args:
+            conn: DuckDB connection
+        """
+        self.logger.info("Creating dim_moon_phase")
+
+        dim_moon_phase_table = self.schema_config.get("dim_moon_phase", "dim_moon_phase")
+
+        # phase_bucket is the centre of each phase as a fraction of the cycle
+        sql = f"""
+        CREATE OR REPLACE TABLE {dim_moon_phase_table} AS
+        SELECT
+            CAST(moon_phase_id AS SMALLINT) AS moon_phase_id,
+            moon_phase_name,
+            CAST(phase_bucket AS REAL) AS phase_bucket
+        FROM (VALUES
+            (0, 'New Moon', 0.0),
+            (1, 'Waxing Crescent', 0.125),
+            (2, 'First Quarter', 0.25),
+            (3, 'Waxing Gibbous', 0.375),
+            (4, 'Full Moon', 0.5),
+            (5, 'Waning Gibbous', 0.625),
+            (6, 'Last Quarter', 0.75),
+            (7, 'Waning Crescent', 0.875),
+            (8, 'Unknown', NULL)
+        ) AS t(moon_phase_id, moon_phase_name, phase_bucket)
+        """
 
-    def _create_fact_earthquakes(self, conn: duckdb.DuckDBPyConnection) -> None:
+        conn.execute(sql)
+        self.logger.info(f"Created {dim_moon_phase_table}")
+
+    def _create_fact_earthquakes(
+        self, conn: duckdb.DuckDBPyConnection, source: str = "raw_valid"
+    ) -> None:
         """Create fact table linking all dimensions.
 
         Args:
             conn: DuckDB connection
+            source: Table of validated raw rows the facts are read from
         """
         self.logger.info("Creating fact_earthquakes")
 
@@ -198,19 +461,28 @@ class OLAPSchema(LoggerMixin):
         dim_time = self.schema_config.get("dim_time", "dim_time")
         dim_location = self.schema_config.get("dim_location", "dim_location")
         dim_magnitude = self.schema_config.get("dim_magnitude", "dim_magnitude")
+        dim_moon_phase = self.schema_config.get("dim_moon_phase", "dim_moon_phase")
 
         # Drop existing table first
         conn.execute(f"DROP TABLE IF EXISTS {fact_table}")
 
-        # Create fact table with proper joins and type casting
+        # Create fact table with proper joins and type casting. Duplicate
+        # events are resolved on a narrow projection of raw row ids; the wide
+        # columns are only read for the rows that survive the semi-join
         sql = f"""
         CREATE TABLE {fact_table} AS
+        WITH keep AS (
+            SELECT rowid AS raw_rowid
+            FROM {source}
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY event_id ORDER BY datetime) = 1
+        )
         SELECT
             r.event_id AS earthquake_id,
             t.time_id,
             l.location_id,
             m.magnitude_id,
             r.event_id,
+            r.datetime AS event_time,
             COALESCE(r.depth, 0.0) AS depth,
             COALESCE(r.depth_category, 'Unknown') AS depth_category,
             COALESCE(CAST(r.num_stations AS INTEGER), 0) AS num_stations,
@@ -220,57 +492,46 @@ class OLAPSchema(LoggerMixin):
             COALESCE(CAST(r.horizontal_error AS DOUBLE), 0.0) AS horizontal_error,
             COALESCE(CAST(r.depth_error AS DOUBLE), 0.0) AS depth_error,
             COALESCE(CAST(r.magnitude_error AS DOUBLE), 0.0) AS magnitude_error,
+            EXP(2.302585092994046 * (1.5 * r.magnitude + 4.8)) AS energy_joules,
             COALESCE(r.network, 'Unknown') AS network,
             COALESCE(r.status, 'Unknown') AS status,
             COALESCE(r.event_type, 'Unknown') AS event_type,
             COALESCE(CAST(r.moon_phase AS DOUBLE), 0.0) AS moon_phase,
-            COALESCE(r.moon_phase_name, 'Unknown') AS moon_phase_name
-        FROM raw_earthquakes r
-        LEFT JOIN {dim_time} t 
-            ON r.datetime = t.datetime
-        LEFT JOIN {dim_location} l 
-            ON r.latitude = l.latitude 
+            COALESCE(p.moon_phase_id, CAST(8 AS SMALLINT)) AS moon_phase_id
+        FROM {source} r
+        SEMI JOIN keep k
+            ON r.rowid = k.raw_rowid
+        LEFT JOIN {dim_time} t
+            ON DATE_TRUNC('hour', r.datetime) = t.datetime
+        -- The hash keys narrow the match; the natural columns make it exact,
+        -- so a 64-bit hash collision cannot attach an event to the wrong row
+        LEFT JOIN {dim_location} l
+            ON hash(r.latitude, r.longitude, r.place_clean, r.region_clean) = l.location_key
+            AND r.latitude = l.latitude
             AND r.longitude = l.longitude
-            AND COALESCE(r.place, 'Unknown') = l.place
-            AND COALESCE(r.region, 'Unknown') = l.region
-        LEFT JOIN {dim_magnitude} m 
-            ON r.magnitude = m.magnitude
-            AND COALESCE(r.magnitude_type, 'Unknown') = m.magnitude_type
-            AND r.magnitude_category = m.magnitude_category
-        WHERE r.datetime IS NOT NULL 
-            AND r.latitude IS NOT NULL 
-            AND r.longitude IS NOT NULL
-            AND r.magnitude IS NOT NULL
+            AND r.place_clean = l.place
+            AND r.region_clean = l.region
+        LEFT JOIN {dim_magnitude} m
+            ON hash(r.magnitude, r.magnitude_type_clean, r.magnitude_category) = m.magnitude_key
+            AND r.magnitude = m.magnitude
+            AND r.magnitude_type_clean = m.magnitude_type
+            AND r.magnitude_category IS NOT DISTINCT FROM m.magnitude_category
+        LEFT JOIN {dim_moon_phase} p
+            ON COALESCE(r.moon_phase_name, 'Unknown') = p.moon_phase_name
+        ORDER BY t.time_id, m.magnitude_id
         """
 
-        conn.execute(sql)
-        
-        # Get counts
-        result = conn.execute(f"SELECT COUNT(*) FROM {fact_table}").fetchone()
-        count = result[0] if result else 0
-        
-        # Check for duplicates
-        dup_result = conn.execute(f"""
-            SELECT COUNT(*) - COUNT(DISTINCT event_id) as duplicates
-            FROM {fact_table}
-        """).fetchone()
-        duplicates = dup_result[0] if dup_result else 0
-        
-        self.logger.info(f"Created {fact_table} with {count:,} records ({duplicates} duplicates)")
-        
-        if duplicates > 0:
-            self.logger.warning(f"Removing {duplicates} duplicate event_ids")
-            # Deduplicate
-            conn.execute(f"""
-                CREATE OR REPLACE TABLE {fact_table} AS
-                SELECT DISTINCT ON (event_id) *
-                FROM {fact_table}
-                ORDER BY event_id
-            """)
-            
-            result = conn.execute(f"SELECT COUNT(*) FROM {fact_table}").fetchone()
-            final_count = result[0] if result else 0
-            self.logger.info(f"After deduplication: {final_count:,} records")
+        # Cluster the fact on its join keys so cube joins probe the dimension
+        # hash tables in order and zonemaps can prune row groups on time_id
+        conn.execute("SET preserve_insertion_order=true")
+        try:
+            conn.execute(sql)
+        finally:
+            conn.execute(
+                f"SET preserve_insertion_order={str(self.config.duckdb.preserve_insertion_order).lower()}"
+            )
+
+        self.logger.info(f"Created {fact_table}")
 
     def validate_schema(self, conn: duckdb.DuckDBPyConnection) -> dict:
         """Validate that the schema was created correctly.
@@ -283,11 +544,16 @@ class OLAPSchema(LoggerMixin):
         """
         self.logger.info("Validating schema")
 
+        tables = {
+            "dim_time": self.schema_config.get("dim_time", "dim_time"),
+            "dim_location": self.schema_config.get("dim_location", "dim_location"),
+            "dim_magnitude": self.schema_config.get("dim_magnitude", "dim_magnitude"),
+            "fact_earthquakes": self.schema_config.get("fact_table", "fact_earthquakes"),
+        }
+        row_counts = self._table_row_counts(conn, list(tables.values()))
+
         validation = {
-            "dim_time": self._validate_table(conn, self.schema_config.get("dim_time", "dim_time")),
-            "dim_location": self._validate_table(conn, self.schema_config.get("dim_location", "dim_location")),
-            "dim_magnitude": self._validate_table(conn, self.schema_config.get("dim_magnitude", "dim_magnitude")),
-            "fact_earthquakes": self._validate_table(conn, self.schema_config.get("fact_table", "fact_earthquakes")),
+            key: self._validate_table(table, row_counts) for key, table in tables.items()
         }
 
         all_valid = all(v["exists"] for v in validation.values())
@@ -300,30 +566,54 @@ class OLAPSchema(LoggerMixin):
 
         return validation
 
-    def _validate_table(self, conn: duckdb.DuckDBPyConnection, table_name: str) -> dict:
-        """Validate a single table.
+    @staticmethod
+    def _table_row_counts(conn: duckdb.DuckDBPyConnection, tables: List[str]) -> Dict[str, int]:
+        """Look up row counts of existing tables in the catalog.
+
+        Uses the row counts DuckDB keeps in its catalog, so no table is scanned.
 
         Args:
             conn: DuckDB connection
+            tables: Names of tables to look up
+
+        Returns:
+            Mapping of table name to row count for the tables that exist
+        """
+        rows = conn.execute(
+            """
+            SELECT table_name, estimated_size
+            FROM duckdb_tables()
+            WHERE database_name = current_database()
+                AND schema_name = current_schema()
+                AND list_contains(?, table_name)
+            """,
+            [tables],
+        ).fetchall()
+        return dict(rows)
+
+    def _validate_table(self, table_name: str, row_counts: Dict[str, int]) -> dict:
+        """Validate a single table.
+
+        Args:
             table_name: Name of table to validate
+            row_counts: Row counts of existing tables from the catalog
 
         Returns:
             Dictionary with validation info
         """
-        try:
-            result = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()
-            count = result[0] if result else 0
+        if table_name in row_counts:
             return {
                 "exists": True,
-                "row_count": count,
-            }
-        except Exception as e:
-            self.logger.error(f"Table {table_name} validation failed: {e}")
-            return {
-                "exists": False,
-                "error": str(e),
+                "row_count": row_counts[table_name],
             }
 
+        error = f"Table {table_name} does not exist"
+        self.logger.error(f"Table {table_name} validation failed: {error}")
+        return {
+            "exists": False,
+            "error": error,
+        }
+
     def get_schema_summary(self, conn: duckdb.DuckDBPyConnection) -> dict:
         """Get summary of the OLAP schema.
 
@@ -333,26 +623,37 @@ class OLAPSchema(LoggerMixin):
         Returns:
             Dictionary with schema summary
         """
-        summary = {}
-
         tables = [
             self.schema_config.get("dim_time", "dim_time"),
             self.schema_config.get("dim_location", "dim_location"),
             self.schema_config.get("dim_magnitude", "dim_magnitude"),
             self.schema_config.get("fact_table", "fact_earthquakes"),
         ]
+        row_counts = self._table_row_counts(conn, tables)
+
+        columns: Dict[str, List[str]] = {}
+        for table_name, column_name in conn.execute(
+            """
+            SELECT table_name, column_name
+            FROM duckdb_columns()
+            WHERE database_name = current_database()
+                AND schema_name = current_schema()
+                AND list_contains(?, table_name)
+            ORDER BY table_name, column_index
+            """,
+            [tables],
+        ).fetchall():
+            columns.setdefault(table_name, []).append(column_name)
 
+        summary = {}
         for table in tables:
-            try:
-                result = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
-                count = result[0] if result else 0
-                columns = conn.execute(f"DESCRIBE {table}").fetchall()
+            if table in row_counts:
                 summary[table] = {
-                    "row_count": count,
-                    "column_count": len(columns),
-                    "columns": [col[0] for col in columns],
+                    "row_count": row_counts[table],
+                    "column_count": len(columns.get(table, [])),
+                    "columns": columns.get(table, []),
                 }
-            except Exception as e:
-                summary[table] = {"error": str(e)}
+            else:
+                summary[table] = {"error": f"Table {table} does not exist"}
 
         return summary
@@ -1,5 +1,7 @@
 """Configuration management for the earthquake OLAP showcase."""
 
+import copy
+import functools
 import os
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
@@ -9,6 +11,25 @@ from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_yaml(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file, memoized on its path and modification time.
+
+    Args:
+        config_path: Resolved path of the YAML file
+        mtime_ns: Modification time of the file, so edits invalidate the cache
+
+    Returns:
+        Parsed YAML content
+    """
+    with open(config_path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
 class PathsConfig(BaseSettings):
     """Path configuration."""
 
@@ -69,6 +90,9 @@ class ETLConfig(BaseSettings):
     download_timeout: int = Field(default=300)
     retry_attempts: int = Field(default=3)
     retry_delay: int = Field(default=5)
+    high_accuracy_moon_phase: bool = Field(default=False)
+    keep_raw_columns: bool = Field(default=False)
+    extra_columns: List[str] = Field(default_factory=list)
     validation: Dict[str, float] = Field(default_factory=dict)
 
 
@@ -133,11 +157,17 @@ class Config(BaseSettings):
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        with open(config_file, "r") as f:
-            yaml_config = yaml.safe_load(f)
+        # Environment variables also feed the settings, so they are part of
+        # the cache key alongside the file's path and modification time
+        config = _load_config(
+            cls,
+            str(config_file.resolve()),
+            config_file.stat().st_mtime_ns,
+            tuple(sorted(os.environ.items())),
+        )
 
-        # Convert nested dict to flat dict for Pydantic
-        return cls(**yaml_config)
+        # Copy the cached instance so callers never share state with it
+        return config.model_copy(deep=True)
 
     def get_duckdb_path(self) -> Path:
         """Get the full path to the DuckDB database file."""
@@ -176,6 +206,25 @@ class Config(BaseSettings):
 _config: Optional[Config] = None
 
 
+@functools.lru_cache(maxsize=4)
+def _load_config(
+    config_cls: type, config_path: str, mtime_ns: int, environ: tuple
+) -> Config:
+    """Validate a YAML configuration, memoized on its inputs.
+
+    Args:
+        config_cls: Config class to build
+        config_path: Resolved path of the YAML file
+        mtime_ns: Modification time of the file, so edits invalidate the cache
+        environ: Snapshot of the environment variables the settings read
+
+    Returns:
+        Validated Config instance; callers must copy it before handing it out
+    """
+    # Copy the cached dict so the instance never shares state with it
+    return config_cls(**copy.deepcopy(_load_yaml(config_path, mtime_ns)))
+
+
 def get_config(reload: bool = False) -> Config:
     """Get the global configuration instance.
 
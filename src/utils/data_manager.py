@@ -1,17 +1,42 @@
 """Data management for incremental loading and year tracking."""
 
+import atexit
+import copy
 import json
+import os
+import queue
+import threading
+import weakref
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 import duckdb
 
 from src.utils.config import Config, get_config
 from src.utils.logger import LoggerMixin, print_info, print_success, print_warning
 
+# Managers with a running metadata writer, closed at exit so queued writes
+# are not lost when a caller never calls close()
+_open_managers: "weakref.WeakSet[DataManager]" = weakref.WeakSet()
+
+
+def _close_open_managers() -> None:
+    """Drain the metadata writers of managers that were never closed."""
+    for manager in list(_open_managers):
+        manager.close()
+
+
+atexit.register(_close_open_managers)
+
 
 class DataManager(LoggerMixin):
-    """Manage incremental data loading and year tracking."""
+    """Manage incremental data loading and year tracking.
+
+    Metadata is read once and changed in memory. Changes are written to disk
+    by a background thread, which coalesces writes queued while it is busy;
+    call close(), or use the manager as a context manager, to wait for them.
+    Managers still open at interpreter exit are closed by an atexit hook.
+    """
 
     def __init__(self, config: Optional[Config] = None):
         """Initialize data manager.
@@ -21,6 +46,83 @@ class DataManager(LoggerMixin):
         """
         self.config = config or get_config()
         self.metadata_file = self.config.paths.data_dir / "metadata.json"
+        self._metadata: Optional[Dict] = None
+        self._dirty = False
+        self._write_queue: "queue.Queue[Optional[Tuple[Dict, bool]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit, waiting for pending metadata writes."""
+        self.close()
+
+    def flush(self, pretty: bool = False) -> None:
+        """Queue pending metadata changes to be written in the background.
+
+        Args:
+            pretty: Indent the JSON for readability instead of writing it compactly
+        """
+        if not self._dirty or self._metadata is None:
+            return
+
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._drain_writes, name="metadata-writer", daemon=True
+            )
+            self._writer.start()
+            _open_managers.add(self)
+
+        # Snapshot, as the cached metadata keeps changing while the write waits
+        self._write_queue.put((copy.deepcopy(self._metadata), pretty))
+        self._dirty = False
+
+    def close(self) -> None:
+        """Write pending metadata changes and wait for the writer to finish."""
+        self.flush()
+
+        if self._writer is not None:
+            self._write_queue.put(None)
+            self._writer.join()
+            self._writer = None
+            _open_managers.discard(self)
+
+    def _mark_changed(self) -> None:
+        """Record that metadata changed and schedule it to be written."""
+        self._dirty = True
+        self.flush()
+
+    def _drain_writes(self) -> None:
+        """Write queued metadata snapshots until close() sends a stop marker.
+
+        Only the newest snapshot waiting in the queue is written, since each
+        one supersedes those queued before it.
+        """
+        while True:
+            item = self._write_queue.get()
+            stop = item is None
+
+            while not stop:
+                try:
+                    newer = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if newer is None:
+                    stop = True
+                else:
+                    item = newer
+
+            if item is not None:
+                metadata, pretty = item
+                try:
+                    self._save_metadata(metadata, pretty=pretty)
+                except Exception as e:
+                    self.logger.error(f"Error saving metadata: {e}")
+
+            if stop:
+                return
 
     def get_loaded_years(self) -> Set[int]:
         """Get set of years that have been loaded.
@@ -72,7 +174,7 @@ class DataManager(LoggerMixin):
         
         metadata["last_updated"] = datetime.now().isoformat()
         
-        self._save_metadata(metadata)
+        self._mark_changed()
         self.logger.info(f"Marked year {year} as loaded")
 
     def get_year_info(self, year: int) -> Optional[Dict]:
@@ -105,7 +207,7 @@ class DataManager(LoggerMixin):
             "loaded_at": datetime.now().isoformat()
         }
         
-        self._save_metadata(metadata)
+        self._mark_changed()
 
     def get_summary(self) -> Dict:
         """Get summary of loaded data.
@@ -162,49 +264,64 @@ class DataManager(LoggerMixin):
         if "year_details" in metadata and str(year) in metadata["year_details"]:
             del metadata["year_details"][str(year)]
         
-        self._save_metadata(metadata)
+        self._mark_changed()
         print_warning(f"Cleared year {year} - will be reprocessed on next run")
 
     def reset_all(self) -> None:
         """Clear all metadata (for complete reset)."""
-        self._save_metadata({
+        self._metadata = {
             "loaded_years": [],
             "year_details": {},
             "last_updated": datetime.now().isoformat()
-        })
+        }
+        self._mark_changed()
         self.logger.info("Reset all metadata")
         print_warning("⚠️ All metadata cleared - all years will be reprocessed")
 
     def _load_metadata(self) -> Dict:
-        """Load metadata from file.
+        """Load metadata, reading the file only on first use.
 
         Returns:
-            Metadata dictionary
+            Metadata dictionary (shared with the manager, so changes to it are
+            flushed)
         """
+        if self._metadata is not None:
+            return self._metadata
+
         if not self.metadata_file.exists():
-            return {
+            self._metadata = {
                 "loaded_years": [],
                 "year_details": {},
                 "created_at": datetime.now().isoformat()
             }
+            return self._metadata
         
         try:
             with open(self.metadata_file, "r") as f:
-                return json.load(f)
+                self._metadata = json.load(f)
         except Exception as e:
             self.logger.error(f"Error loading metadata: {e}")
-            return {"loaded_years": [], "year_details": {}}
+            self._metadata = {"loaded_years": [], "year_details": {}}
+        return self._metadata
 
-    def _save_metadata(self, metadata: Dict) -> None:
+    def _save_metadata(self, metadata: Dict, pretty: bool = False) -> None:
         """Save metadata to file.
 
         Args:
             metadata: Metadata dictionary
+            pretty: Indent the JSON instead of writing it compactly
         """
         self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(self.metadata_file, "w") as f:
-            json.dump(metadata, f, indent=2)
+
+        # Write to a sibling file and swap it in, so a crash mid-write never
+        # leaves a truncated metadata file behind
+        tmp_file = self.metadata_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
+            if pretty:
+                json.dump(metadata, f, indent=2)
+            else:
+                json.dump(metadata, f, separators=(",", ":"))
+        os.replace(tmp_file, self.metadata_file)
 
     def validate_loaded_years(self, conn: duckdb.DuckDBPyConnection) -> List[int]:
         """Validate that yearly tables actually exist for loaded years.
@@ -218,16 +335,23 @@ class DataManager(LoggerMixin):
         metadata = self._load_metadata()
         claimed_years = set(metadata.get("loaded_years", []))
         
-        # Check which tables actually exist
-        actual_years = set()
-        for year in claimed_years:
-            table_name = f"raw_earthquakes_{year}"
-            try:
-                result = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()
-                if result and result[0] > 0:
-                    actual_years.add(year)
-            except:
-                pass
+        # Non-empty yearly tables come from the catalog in one query instead
+        # of counting the rows of each table
+        existing_tables = {
+            row[0]
+            for row in conn.execute(
+                """
+                SELECT table_name
+                FROM duckdb_tables()
+                WHERE database_name = current_database()
+                    AND table_name LIKE 'raw_earthquakes_%'
+                    AND estimated_size > 0
+                """
+            ).fetchall()
+        }
+        actual_years = {
+            year for year in claimed_years if f"raw_earthquakes_{year}" in existing_tables
+        }
         
         # Find missing years
         missing_years = claimed_years - actual_years
@@ -243,7 +367,7 @@ class DataManager(LoggerMixin):
                     if str(year) in metadata["year_details"]:
                         del metadata["year_details"][str(year)]
             
-            self._save_metadata(metadata)
+            self._mark_changed()
             
             from src.utils.logger import print_warning
             print_warning(f"⚠️ Removed {len(missing_years)} missing year(s) from metadata: {sorted(missing_years)}")
@@ -1,14 +1,90 @@
 """Logging configuration and utilities."""
 
+import atexit
+import copy
 import logging
 import logging.config
+import logging.handlers
+import os
+import queue
 import sys
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-import yaml
-from rich.console import Console
-from rich.logging import RichHandler
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# yaml and rich are imported where they are used, so modules that only need
+# get_logger or LoggerMixin do not pay for importing them
+
+# Parsed logging configs keyed by (path, mtime_ns, size), so repeated
+# setup_logging calls skip reading the file until it changes
+_CONFIG_CACHE: Dict[Tuple[str, int, int], dict] = {}
+
+# Log directory, created on the first setup call in this process
+_LOGS_DIR = Path("logs")
+_logs_ready = False
+
+
+class _StandardFormatter(logging.Formatter):
+    """Formatter for ``asctime - name - levelname - message`` lines.
+
+    Builds the line with a single f-string instead of %-style substitution,
+    and reuses the timestamp text for records logged within the same second.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(datefmt="%Y-%m-%d %H:%M:%S")
+        self._last_asctime = (-1, "")
+
+    def formatTime(  # noqa: N802
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        second = int(record.created)
+        cached_second, asctime = self._last_asctime
+        if second != cached_second:
+            asctime = super().formatTime(record, datefmt)
+            self._last_asctime = (second, asctime)
+        return asctime
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        line = (
+            f"{self.formatTime(record, self.datefmt)} - {record.name} - "
+            f"{record.levelname} - {record.message}"
+        )
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line = f"{line}\n{record.exc_text}"
+        if record.stack_info:
+            line = f"{line}\n{self.formatStack(record.stack_info)}"
+        return line
+
+
+# Formatter for the fallback console and file handlers, shared across setups
+_STANDARD_FORMATTER = _StandardFormatter()
+
+# Whether the fallback console handler and the print helpers render through
+# rich. Decided once per process: only on a terminal, and EARTHQUAKE_OLAP_RICH=0
+# or NO_COLOR turn it off. Plain-mode processes never import rich
+_RICH_CONSOLE = (
+    sys.stdout.isatty()
+    and os.environ.get("EARTHQUAKE_OLAP_RICH", "1") != "0"
+    and not os.environ.get("NO_COLOR")
+)
+
+# Configuration currently applied: ("yaml", cache key) or ("basic", use_rich).
+# Repeating the same configuration only adjusts levels instead of rebuilding
+_applied_config: Optional[Tuple[Any, ...]] = None
+
+# Upper bound on records waiting for the background listener; callers block
+# once it is full instead of letting the queue grow without limit
+_LOG_QUEUE_SIZE = 10_000
+
+# Listener thread feeding the fallback handlers, if one is running
+_queue_listener: Optional[logging.handlers.QueueListener] = None
 
 
 def setup_logging(
@@ -23,17 +99,55 @@ def setup_logging(
         default_level: Default logging level if config file not found
         use_rich: Use rich console handler for prettier output
     """
-    config_file = Path(config_path)
+    global _applied_config, _logs_ready
+
+    config_file = os.fspath(config_path)
+
+    # No format uses thread or process fields, so skip capturing them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
     # Ensure logs directory exists
-    logs_dir = Path("logs")
-    logs_dir.mkdir(exist_ok=True)
+    if not _logs_ready:
+        _LOGS_DIR.mkdir(exist_ok=True)
+        _logs_ready = True
+
+    try:
+        st = os.stat(config_file)
+    except OSError:
+        st = None
+
+    # Prefer a JSON copy written by scripts/convert_logging_config.py, as long
+    # as it is not older than the file it was generated from
+    json_file = os.path.splitext(config_file)[0] + ".json"
+    if json_file != config_file:
+        try:
+            json_st = os.stat(json_file)
+        except OSError:
+            json_st = None
+        if json_st is not None and (st is None or json_st.st_mtime_ns >= st.st_mtime_ns):
+            config_file, st = json_file, json_st
 
-    if config_file.exists():
+    if st is not None:
         try:
-            with open(config_file, "r") as f:
-                config = yaml.safe_load(f)
-                logging.config.dictConfig(config)
+            key = (config_file, st.st_mtime_ns, st.st_size)
+            config = _CONFIG_CACHE.get(key)
+            if config is None:
+                config = _read_config(config_file)
+                _CONFIG_CACHE[key] = config
+            # dictConfig consumes parts of the dict it is given
+            config = copy.deepcopy(config)
+            applied = ("yaml", key)
+            if _applied_config == applied:
+                # Handlers from the previous call are still in place; only
+                # logger and handler levels need to be reapplied
+                config["incremental"] = True
+            else:
+                _applied_config = None
+                _stop_queue_listener()
+            logging.config.dictConfig(config)
+            _applied_config = applied
         except Exception as e:
             print(f"Error loading logging config: {e}", file=sys.stderr)
             _setup_basic_logging(default_level, use_rich)
@@ -41,49 +155,205 @@ def setup_logging(
         _setup_basic_logging(default_level, use_rich)
 
 
+def _read_config(path: str) -> dict:
+    """Parse a logging config file.
+
+    JSON files are parsed with orjson when it is installed (stdlib json
+    otherwise); anything else is parsed as YAML.
+
+    Args:
+        path: Path to a ``.json`` or YAML logging config
+
+    Returns:
+        Logging configuration dictionary
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if path.endswith(".json"):
+        try:
+            from orjson import loads
+        except ImportError:
+            from json import loads
+        return loads(data)
+
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(data, Loader=loader)
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """File handler writing UTF-8 bytes through a 64 KiB buffer.
+
+    Unlike ``FileHandler``, records are not flushed one by one: the buffer is
+    written out when it fills, on WARNING and above, and on close.
+    """
+
+    def __init__(self, filename: str) -> None:
+        super().__init__(filename, mode="ab")
+
+    def _open(self):  # type: ignore[no-untyped-def]
+        return open(self.baseFilename, self.mode, buffering=1 << 16)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record) + self.terminator
+            self.stream.write(line.encode("utf-8", "backslashreplace"))
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _BlockingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that waits for room in a bounded queue.
+
+    Records keep their ``exc_info`` so handlers on the listener thread, such
+    as RichHandler with rich tracebacks, can still render the exception.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the args on the calling thread, as they may change once queued
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put(record)
+
+
+def _stop_queue_listener() -> None:
+    """Stop the background logging listener and close its handlers.
+
+    The listener holds the only references to its handlers, so they are
+    closed here to flush buffered records before they are discarded.
+    """
+    global _queue_listener
+
+    if _queue_listener is None:
+        return
+
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
+    _queue_listener = None
+
+
+def _plain_console_handler(level: int) -> logging.Handler:
+    """Create the standard stdout console handler.
+
+    Args:
+        level: Logging level
+
+    Returns:
+        Console handler
+    """
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(level)
+    console_handler.setFormatter(_STANDARD_FORMATTER)
+    return console_handler
+
+
+def _rich_console_handler(level: int) -> logging.Handler:
+    """Create a rich console handler for beautiful terminal output.
+
+    Args:
+        level: Logging level
+
+    Returns:
+        Console handler
+    """
+    from rich.logging import RichHandler
+
+    console_handler = RichHandler(
+        rich_tracebacks=True,
+        markup=True,
+        show_time=True,
+        show_path=True,
+    )
+    console_handler.setLevel(level)
+    return console_handler
+
+
+# Console handler factory used when rich output is requested, bound once so
+# plain-mode processes never import rich
+_console_handler = _rich_console_handler if _RICH_CONSOLE else _plain_console_handler
+
+
 def _setup_basic_logging(level: int = logging.INFO, use_rich: bool = True) -> None:
     """Setup basic logging configuration as fallback.
 
+    Console and file handlers run on a background ``QueueListener`` thread, so
+    logging calls only pay for putting the record on a queue. This lowers
+    latency at the call site; it does not raise throughput, and the queue is
+    bounded so a slow handler applies back-pressure rather than using memory.
+
     Args:
         level: Logging level
-        use_rich: Use rich console handler
+        use_rich: Use rich console handler when the process allows it
     """
-    # Clear any existing handlers
+    global _applied_config, _queue_listener
+
+    # Same fallback setup already running: only the console level can differ
+    applied = ("basic", use_rich)
+    if _applied_config == applied and _queue_listener is not None:
+        _queue_listener.handlers[0].setLevel(level)
+        return
+    _applied_config = None
+
+    # Close and clear any existing handlers so their files are flushed and released
+    _stop_queue_listener()
     root_logger = logging.getLogger()
+    for handler in root_logger.handlers:
+        try:
+            handler.flush()
+            handler.close()
+        except Exception:
+            # A handler that fails to close must not block reconfiguration
+            pass
     root_logger.handlers.clear()
 
     if use_rich:
-        # Use Rich handler for beautiful console output
-        console_handler = RichHandler(
-            rich_tracebacks=True,
-            markup=True,
-            show_time=True,
-            show_path=True,
-        )
-        console_handler.setLevel(level)
+        console_handler = _console_handler(level)
     else:
-        # Standard console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        console_handler.setFormatter(formatter)
+        console_handler = _plain_console_handler(level)
 
-    # File handler
-    file_handler = logging.FileHandler("logs/earthquake_olap.log")
+    # File handler, buffered in memory and written out in batches
+    file_handler = _BufferedFileHandler("logs/earthquake_olap.log")
     file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+    file_handler.setFormatter(_STANDARD_FORMATTER)
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    buffered_handler.setLevel(logging.DEBUG)
+
+    # Hand records to a listener thread that runs the real handlers
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=_LOG_QUEUE_SIZE)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, buffered_handler, respect_handler_level=True
     )
-    file_handler.setFormatter(file_formatter)
+    _queue_listener.start()
 
     # Configure root logger
     root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(_BlockingQueueHandler(log_queue))
+    _applied_config = applied
+
+
+# Drain the listener before logging.shutdown flushes and closes the handlers
+atexit.register(_stop_queue_listener)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -95,43 +365,170 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
-    return logging.getLogger(name)
+    # Interned so logger names built at runtime (e.g. by LoggerMixin) share one
+    # string object with the logging manager's key
+    return logging.getLogger(sys.intern(name))
 
 
 class LoggerMixin:
-    """Mixin class to add logging capability to any class."""
+    """Mixin class to add logging capability to any class.
+
+    The logger is resolved once per class when the subclass is defined, so
+    ``self.logger`` is a plain attribute load on hot paths.
+    """
+
+    _logger: logging.Logger = logging.getLogger(f"{__name__}.LoggerMixin")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._logger = get_logger(f"{cls.__module__}.{cls.__name__}")
 
     @property
     def logger(self) -> logging.Logger:
         """Get logger for this class."""
-        name = f"{self.__class__.__module__}.{self.__class__.__name__}"
-        return get_logger(name)
+        return self._logger
+
+    def log_debug(self, msg: str, *args: Any) -> None:
+        """Log a debug message, formatting it only if debug logging is enabled.
+
+        Pass values as ``%``-style args rather than an f-string so the message
+        is never built when debug records would be dropped.
+
+        Args:
+            msg: Message format string
+            *args: Values substituted into ``msg``
+        """
+        logger = self._logger
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(msg, *args, stacklevel=2)
+
+    def log_debug_lazy(self, msg: str, *thunks: Callable[[], Any]) -> None:
+        """Log a debug message whose args are computed only if it will be emitted.
+
+        Example: ``self.log_debug_lazy("rows: %s", lambda: df.height)``.
+
+        Args:
+            msg: Message format string
+            *thunks: Zero-argument callables producing the values for ``msg``
+        """
+        logger = self._logger
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(msg, *(thunk() for thunk in thunks), stacklevel=2)
 
 
-# Rich console for pretty printing (optional utility)
-console = Console()
+# Rich console for pretty printing (optional utility), created on first use
+_console: Optional["Console"] = None
+
+
+def _get_console() -> "Console":
+    """Get the shared rich console, creating it on first use.
+
+    Returns:
+        Rich console instance
+    """
+    global _console
+
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+
+    return _console
+
+
+# Markup prefixes for the print helpers; the message is passed to
+# console.print as a separate argument and joined with a space
+_INFO_PREFIX = "[blue]ℹ[/blue]"
+_SUCCESS_PREFIX = "[green]✓[/green]"
+_WARNING_PREFIX = "[yellow]⚠[/yellow]"
+_ERROR_PREFIX = "[red]✗[/red]"
+
+# Plain-text lines collected by an active batched_console block
+_plain_batch: Optional[List[str]] = None
+
+
+def _write_plain(text: str) -> None:
+    """Write plain helper output, or collect it inside batched_console."""
+    if _plain_batch is not None:
+        _plain_batch.append(text)
+    else:
+        sys.stdout.write(text)
+
+
+@contextmanager
+def batched_console() -> Iterator[None]:
+    """Collect print helper output and write it to stdout in one call.
+
+    Useful when emitting many status lines in a loop: the lines are rendered
+    into a buffer and written with a single ``write()`` when the block exits,
+    rather than one write per message.
+
+    Yields:
+        None
+    """
+    global _plain_batch
+
+    if _RICH_CONSOLE:
+        capture = _get_console().capture()
+        try:
+            with capture:
+                yield
+        finally:
+            sys.stdout.write(capture.get())
+        return
+
+    outer = _plain_batch
+    _plain_batch = []
+    try:
+        yield
+    finally:
+        text = "".join(_plain_batch)
+        _plain_batch = outer
+        _write_plain(text)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazily created ``console`` module attribute."""
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def print_info(message: str) -> None:
     """Print info message with rich formatting."""
-    console.print(f"[blue]ℹ[/blue] {message}")
+    if _RICH_CONSOLE:
+        _get_console().print(_INFO_PREFIX, message)
+    else:
+        _write_plain(f"[INFO] {message}\n")
 
 
 def print_success(message: str) -> None:
     """Print success message with rich formatting."""
-    console.print(f"[green]✓[/green] {message}")
+    if _RICH_CONSOLE:
+        _get_console().print(_SUCCESS_PREFIX, message)
+    else:
+        _write_plain(f"[OK] {message}\n")
 
 
 def print_warning(message: str) -> None:
     """Print warning message with rich formatting."""
-    console.print(f"[yellow]⚠[/yellow] {message}")
+    if _RICH_CONSOLE:
+        _get_console().print(_WARNING_PREFIX, message)
+    else:
+        _write_plain(f"[WARNING] {message}\n")
 
 
 def print_error(message: str) -> None:
     """Print error message with rich formatting."""
-    console.print(f"[red]✗[/red] {message}")
+    if _RICH_CONSOLE:
+        _get_console().print(_ERROR_PREFIX, message)
+    else:
+        _write_plain(f"[ERROR] {message}\n")
 
 
 def print_section(title: str) -> None:
     """Print a section header."""
-    console.rule(f"[bold blue]{title}[/bold blue]")
+    if _RICH_CONSOLE:
+        _get_console().rule(f"[bold blue]{title}[/bold blue]")
+    else:
+        _write_plain(f"---- {title} ----\n")
@@ -0,0 +1,113 @@
+"""Shared fixtures for the test suite."""
+
+import random
+from pathlib import Path
+from typing import Iterator
+
+import duckdb
+import pytest
+
+from src.utils.config import Config, PathsConfig
+
+CONFIG_FILE = Path(__file__).parent.parent / "config" / "config.yaml"
+
+USGS_HEADER = (
+    "time,latitude,longitude,depth,mag,magType,nst,gap,dmin,rms,net,id,updated,place,type,"
+    "horizontalError,depthError,magError,magNst,status,locationSource,magSource"
+)
+
+PLACES = [
+    "10 km N of Tokyo, Japan",
+    "Fiji region",
+    "5km S of Lima, Peru",
+    "South of the Fiji Islands",
+    None,
+]
+
+
+def write_usgs_csv(path: Path, rows: int = 1500, seed: int = 1) -> Path:
+    """Write a synthetic USGS-format CSV.
+
+    Args:
+        path: Destination file
+        rows: Number of events
+        seed: Random seed, so runs are reproducible
+
+    Returns:
+        Path to the written file
+    """
+    rng = random.Random(seed)
+    lines = [USGS_HEADER]
+
+    for i in range(rows):
+        ts = (
+            f"{rng.choice([2021, 2022, 2023])}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            f"T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}"
+            f".{rng.randint(0, 999):03d}Z"
+        )
+        place = rng.choice(PLACES)
+        values = [
+            ts,
+            round(rng.uniform(-80, 80), 3),
+            round(rng.uniform(-179, 179), 3),
+            round(rng.uniform(0, 600), 2),
+            round(rng.uniform(2.0, 8.9), 1),
+            rng.choice(["mb", "mww", ""]),
+            rng.randint(10, 100),
+            30,
+            1.2,
+            0.8,
+            "us",
+            f"us{i}",
+            ts,
+            f'"{place}"' if place else "",
+            "earthquake",
+            5.0,
+            2.0,
+            0.1,
+            20,
+            "reviewed",
+            "us",
+            "us",
+        ]
+        lines.append(",".join(str(value) for value in values))
+
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> Config:
+    """Project configuration with every data path inside a temporary directory."""
+    data_dir = tmp_path / "data"
+    paths = PathsConfig(
+        data_dir=data_dir,
+        raw_dir=data_dir / "raw",
+        processed_dir=data_dir / "processed",
+        duckdb_dir=data_dir / "duckdb",
+        duckdb_file=data_dir / "duckdb" / "earthquakes.duckdb",
+        cache_dir=data_dir / "cache",
+    )
+    config = Config.from_yaml(str(CONFIG_FILE)).model_copy(update={"paths": paths})
+    config.paths.ensure_directories()
+    return config
+
+
+@pytest.fixture
+def warehouse(config: Config, tmp_path: Path) -> Iterator[duckdb.DuckDBPyConnection]:
+    """DuckDB connection holding raw data and the star schema built from it."""
+    from src.etl.extract import DataExtractor
+    from src.etl.load import DataLoader
+    from src.etl.transform import DataTransformer
+    from src.olap.schema import OLAPSchema
+
+    csv_path = write_usgs_csv(tmp_path / "events.csv")
+    df = DataTransformer(config).transform(DataExtractor(config).extract_csv(csv_path))
+
+    with DataLoader(config) as loader:
+        loader.load_raw_data(df)
+
+    conn = duckdb.connect(str(config.get_duckdb_path()))
+    OLAPSchema(config).create_star_schema(conn)
+    yield conn
+    conn.close()
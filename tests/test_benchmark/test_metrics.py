@@ -0,0 +1,94 @@
+"""Tests for benchmark metrics tracking."""
+
+import json
+
+import psutil
+import pytest
+
+from src.benchmark.metrics import (
+    BenchmarkContext,
+    BenchmarkTracker,
+    format_bytes,
+    format_duration,
+)
+
+
+@pytest.fixture
+def tracker(config, monkeypatch) -> BenchmarkTracker:
+    # cpu_percent(interval=1) would sleep for a second per tracker
+    monkeypatch.setattr(psutil, "cpu_percent", lambda interval=None: 12.5)
+    return BenchmarkTracker(config)
+
+
+def test_context_records_duration_and_metadata(tracker):
+    with BenchmarkContext(tracker, "extract", {"rows": 10}):
+        pass
+
+    metric = tracker.result.metrics["extract"]
+    assert metric.duration is not None and metric.duration >= 0
+    assert metric.metadata == {"rows": 10}
+
+
+def test_context_marks_failed_metrics(tracker):
+    with pytest.raises(RuntimeError):
+        with BenchmarkContext(tracker, "load"):
+            raise RuntimeError("disk full")
+
+    assert tracker.result.metrics["load"].metadata == {"error": "disk full", "failed": True}
+
+
+def test_stopping_an_unknown_metric_returns_zero(tracker):
+    assert tracker.stop_metric("missing") == 0.0
+
+
+def test_save_results_writes_summary(tracker, tmp_path):
+    tracker.start_metric("transform")
+    tracker.stop_metric("transform", {"rows": 3})
+    tracker.start_metric("unfinished")
+    tracker.record_data_info("peak_memory_usage_mb", tracker.get_memory_usage()["rss_mb"])
+
+    path = tracker.save_results(tmp_path / "results.json")
+
+    with open(path) as f:
+        saved = json.load(f)
+    assert saved["summary"]["metric_count"] == 2
+    assert saved["summary"]["completed_metrics"] == 1
+    assert saved["metrics"]["transform"]["metadata"] == {"rows": 3}
+    assert saved["metrics"]["unfinished"]["end_time"] is None
+    assert saved["system_info"]["cpu_percent"] == 12.5
+
+
+def test_save_results_defaults_to_the_benchmark_directory(tracker, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    path = tracker.save_results()
+
+    assert path.parent == tracker.config.benchmark.output_dir
+    assert path.name == f"benchmark_{tracker.run_id}.json"
+    assert path.exists()
+
+
+def test_print_summary_lists_completed_metrics(tracker, capsys):
+    with BenchmarkContext(tracker, "olap_cubes", {"cubes": 6}):
+        pass
+    tracker.record_data_info("rows", 42)
+
+    tracker.print_summary()
+
+    out = capsys.readouterr().out
+    assert "olap_cubes" in out and "cubes=6" in out and "rows: 42" in out
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(512, "512.00 B"), (1536, "1.50 KB"), (3 * 1024**3, "3.00 GB"), (2 * 1024**5, "2.00 PB")],
+)
+def test_format_bytes(value, expected):
+    assert format_bytes(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("seconds", "expected"), [(5.5, "5.50s"), (150, "2m 30s"), (7260, "2h 1m")]
+)
+def test_format_duration(seconds, expected):
+    assert format_duration(seconds) == expected
@@ -0,0 +1,140 @@
+"""Tests for downloading USGS data."""
+
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+import src.etl.download as download_module
+from src.etl.download import DataDownloader
+
+
+def _with_date_range(config, start: str, end: str):
+    params = {**config.data_source.params, "starttime": start, "endtime": end}
+    data_source = config.data_source.model_copy(update={"params": params, "use_api": True})
+    return config.model_copy(update={"data_source": data_source})
+
+
+def _mock_stream(monkeypatch, response: httpx.Response) -> None:
+    """Serve every httpx.stream call with the given response."""
+    transport = httpx.MockTransport(lambda request: response)
+
+    def mock_stream(method, url, **kwargs):
+        return httpx.Client(transport=transport).stream(method, url, **kwargs)
+
+    monkeypatch.setattr(httpx, "stream", mock_stream)
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(download_module.time, "sleep", lambda seconds: None)
+
+
+def test_date_chunks_cover_the_range_without_overlap(config):
+    start, end = datetime(2020, 1, 1), datetime(2023, 6, 30)
+
+    chunks = DataDownloader(config)._create_date_chunks(start, end)
+
+    assert chunks[0][0] == start and chunks[-1][1] == end
+    for (_, previous_end), (next_start, _) in zip(chunks, chunks[1:]):
+        assert next_start == previous_end + timedelta(days=1)
+
+
+def test_long_ranges_download_in_chunks_and_skip_failures(config, monkeypatch):
+    downloader = DataDownloader(_with_date_range(config, "2020-01-01", "2022-12-31"))
+    urls = []
+
+    def fake_download(url, output_path, force=False):
+        urls.append(url)
+        if len(urls) == 2:
+            raise httpx.ConnectError("offline")
+        return output_path
+
+    monkeypatch.setattr(downloader, "_download_single_file", fake_download)
+
+    files = downloader.download()
+
+    assert "starttime=2020-01-01" in urls[0] and "endtime=2022-12-31" in urls[-1]
+    assert len(files) == len(urls) - 1
+    assert all(path.parent == config.paths.raw_dir for path in files)
+
+
+def test_all_chunks_failing_raises(config, monkeypatch):
+    downloader = DataDownloader(_with_date_range(config, "2020-01-01", "2022-12-31"))
+
+    def failing_download(url, output_path, force=False):
+        raise httpx.ConnectError("offline")
+
+    monkeypatch.setattr(downloader, "_download_single_file", failing_download)
+
+    with pytest.raises(RuntimeError, match="All chunk downloads failed"):
+        downloader.download()
+
+
+def test_short_ranges_download_one_file(config, monkeypatch):
+    downloader = DataDownloader(_with_date_range(config, "2024-01-01", "2024-06-30"))
+    monkeypatch.setattr(
+        downloader, "_download_single_file", lambda url, output_path, force=False: output_path
+    )
+
+    assert downloader.download() == [config.paths.raw_dir / "earthquakes_20240101_20240630.csv"]
+
+
+def test_existing_files_are_reused(config, monkeypatch):
+    downloader = DataDownloader(config)
+    cached = config.paths.raw_dir / "earthquakes_20240101_20240630.csv"
+    cached.write_text("time\n")
+    monkeypatch.setattr(downloader, "_download_with_progress", pytest.fail)
+
+    assert downloader._download_single_file("http://example.invalid", cached) == cached
+    assert downloader.get_cached_files() == [cached]
+
+
+def test_failed_attempts_are_retried(config, monkeypatch, no_sleep):
+    downloader = DataDownloader(config)
+    attempts = []
+
+    def flaky_download(url, output_path):
+        attempts.append(url)
+        if len(attempts) < downloader.retry_attempts:
+            raise httpx.ReadTimeout("slow")
+        return output_path
+
+    monkeypatch.setattr(downloader, "_download_with_progress", flaky_download)
+    output_path = config.paths.raw_dir / "events.csv"
+
+    assert downloader._download_single_file("http://example.invalid", output_path) == output_path
+    assert len(attempts) == downloader.retry_attempts
+
+
+def test_last_failed_attempt_is_raised(config, monkeypatch, no_sleep):
+    downloader = DataDownloader(config)
+
+    def failing_download(url, output_path):
+        raise httpx.ReadTimeout("slow")
+
+    monkeypatch.setattr(downloader, "_download_with_progress", failing_download)
+
+    with pytest.raises(httpx.ReadTimeout):
+        downloader._download_single_file(
+            "http://example.invalid", config.paths.raw_dir / "events.csv"
+        )
+
+
+def test_download_streams_the_response_to_disk(config, monkeypatch):
+    body = b"time,latitude\n" * 2000
+    _mock_stream(monkeypatch, httpx.Response(200, content=body))
+    output_path = config.paths.raw_dir / "events.csv"
+
+    DataDownloader(config)._download_with_progress("http://example.invalid/events.csv", output_path)
+
+    assert output_path.read_bytes() == body
+
+
+def test_http_errors_are_raised(config, monkeypatch):
+    _mock_stream(monkeypatch, httpx.Response(503))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        DataDownloader(config)._download_with_progress(
+            "http://example.invalid/events.csv", config.paths.raw_dir / "events.csv"
+        )
@@ -0,0 +1,70 @@
+"""Tests for CSV extraction."""
+
+import polars as pl
+import pytest
+
+from src.etl.extract import DataExtractor
+from tests.conftest import write_usgs_csv
+
+
+@pytest.fixture
+def extractor(config) -> DataExtractor:
+    return DataExtractor(config)
+
+
+def test_pandas_fallback_converts_to_polars(extractor, tmp_path):
+    csv_path = write_usgs_csv(tmp_path / "events.csv", rows=200)
+
+    fallback = extractor.extract_multiple_csv([csv_path], use_polars=False)
+    expected = extractor.extract_csv(csv_path)
+
+    assert isinstance(fallback, pl.DataFrame)
+    fallback, expected = fallback.sort("id"), expected.sort("id")
+    for column in ("id", "mag", "latitude", "depth", "nst"):
+        assert fallback[column].to_list() == expected[column].to_list()
+
+
+def test_pandas_fallback_keeps_timestamps_as_strings(extractor, tmp_path):
+    csv_path = write_usgs_csv(tmp_path / "events.csv", rows=50)
+
+    fallback = extractor.extract_csv(csv_path, use_polars=False)
+    expected = extractor.extract_csv(csv_path)
+
+    for column in ("time", "updated"):
+        assert str(fallback[column].dtype).startswith("string")
+        assert fallback[column].tolist() == expected[column].to_list()
+
+
+def test_multiple_files_are_combined_without_duplicates(extractor, tmp_path):
+    first = write_usgs_csv(tmp_path / "first.csv", rows=100)
+    # Same seed, so the first 100 events repeat with the same ids
+    second = write_usgs_csv(tmp_path / "second.csv", rows=150)
+    empty = write_usgs_csv(tmp_path / "empty.csv", rows=0)
+
+    combined = extractor.extract_multiple_csv([first, empty, second])
+
+    assert combined["id"].n_unique() == len(combined) == 150
+
+
+def test_only_empty_files_raise(extractor, tmp_path):
+    empty = write_usgs_csv(tmp_path / "empty.csv", rows=0)
+
+    with pytest.raises(RuntimeError):
+        extractor.extract_multiple_csv([empty])
+
+
+def test_missing_file_raises(extractor, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        extractor.extract_csv(tmp_path / "missing.csv")
+
+
+@pytest.mark.parametrize("use_polars", [True, False])
+def test_schema_info_for_both_frame_types(extractor, tmp_path, use_polars):
+    csv_path = write_usgs_csv(tmp_path / "events.csv", rows=20)
+    df = extractor.extract_csv(csv_path, use_polars=use_polars)
+
+    info = extractor.get_schema_info(df)
+
+    assert info["shape"] == (20, 22)
+    assert list(info["columns"]) == list(df.columns)
+    assert len(extractor.preview_data(df, n_rows=3)) == 3
@@ -0,0 +1,56 @@
+"""Tests for loading data into DuckDB."""
+
+from datetime import datetime, timedelta
+
+import polars as pl
+import pytest
+
+from src.etl.load import DataLoader
+
+
+@pytest.fixture
+def events() -> pl.DataFrame:
+    """Events deliberately out of datetime order."""
+    start = datetime(2024, 1, 1)
+    return pl.DataFrame(
+        {
+            "event_id": [f"ev{i}" for i in range(300)],
+            "datetime": [start + timedelta(hours=(i * 37) % 300) for i in range(300)],
+            "magnitude": [round(2.0 + (i * 7 % 60) / 10, 1) for i in range(300)],
+            "place": [None if i % 5 == 0 else f"place {i % 7}" for i in range(300)],
+        }
+    )
+
+
+def test_load_raw_data_keeps_every_row(config, events):
+    with DataLoader(config) as loader:
+        loader.load_raw_data(events)
+        info = loader.get_table_info()
+        loaded = loader.conn.execute("SELECT * FROM raw_earthquakes").pl()
+
+    assert info["row_count"] == len(events)
+    assert [column["name"] for column in info["columns"]] == events.columns
+    assert loaded.sort("event_id").equals(events.sort("event_id"))
+
+
+def test_raw_rows_are_stored_in_datetime_order(config, events):
+    with DataLoader(config) as loader:
+        loader.load_raw_data(events)
+        stored = loader.conn.execute("SELECT datetime, magnitude FROM raw_earthquakes").fetchall()
+
+    assert stored == sorted(stored)
+
+
+def test_export_to_parquet_applies_the_options(config, events):
+    with DataLoader(config) as loader:
+        loader.load_raw_data(events)
+        path = loader.export_to_parquet(compression="snappy")
+        metadata = loader.conn.execute(
+            "SELECT DISTINCT row_group_id, row_group_num_rows, compression "
+            "FROM parquet_metadata(?)",
+            [str(path)],
+        ).fetchall()
+
+    assert path == config.paths.processed_dir / "raw_earthquakes.parquet"
+    assert {compression for _, _, compression in metadata} == {"SNAPPY"}
+    assert sum(rows for _, rows, _ in metadata) == len(events)
@@ -0,0 +1,118 @@
+"""Tests for the data transformer."""
+
+from datetime import datetime
+
+import polars as pl
+import pytest
+
+from src.etl.transform import DataTransformer
+
+USGS_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S%.3fZ"
+
+
+@pytest.fixture
+def transformer(config) -> DataTransformer:
+    return DataTransformer(config)
+
+
+def _parse(transformer: DataTransformer, values: list) -> list:
+    df = pl.DataFrame({"time": values}, schema={"time": pl.Utf8})
+    return df.select(transformer._parse_time(df["time"])).to_series().to_list()
+
+
+def _strptime(values: list) -> list:
+    df = pl.DataFrame({"time": values}, schema={"time": pl.Utf8})
+    parsed = df.select(pl.col("time").str.strptime(pl.Datetime, USGS_TIME_FORMAT))
+    return parsed.to_series().to_list()
+
+
+class TestParseTime:
+    """Fixed-width fast path and strptime fallback of _parse_time."""
+
+    def test_fast_path_matches_strptime(self, transformer):
+        values = [
+            "2024-02-29T23:59:59.999Z",
+            "2023-12-31T00:00:00.000Z",
+            "1999-01-01T12:34:56.007Z",
+            None,
+        ]
+
+        assert _parse(transformer, values) == _strptime(values)
+
+    def test_fast_path_keeps_milliseconds(self, transformer):
+        assert _parse(transformer, ["2021-06-15T08:09:10.123Z"]) == [
+            datetime(2021, 6, 15, 8, 9, 10, 123000)
+        ]
+
+    def test_falls_back_when_any_value_is_not_fixed_width(self, transformer):
+        values = ["2021-06-15T08:09:10.123Z", "2021-06-15T08:09:10Z"]
+
+        assert _parse(transformer, values) == _strptime(values)
+
+    def test_only_fixed_width_columns_skip_strptime(self, transformer):
+        fixed = pl.Series("time", ["2021-06-15T08:09:10.123Z", None])
+        mixed = pl.Series("time", ["2021-06-15T08:09:10.123Z", "2021-06-15T08:09:10Z"])
+
+        assert "strptime" not in str(transformer._parse_time(fixed))
+        assert "strptime" in str(transformer._parse_time(mixed))
+
+    def test_fallback_rejects_malformed_values(self, transformer):
+        # The error class depends on the polars version
+        with pytest.raises((pl.exceptions.ComputeError, pl.exceptions.InvalidOperationError)):
+            _parse(transformer, ["2021-06-15 08:09:10"])
+
+
+def _case_magnitude(magnitude: float) -> str:
+    """Magnitude categories as assigned by the former when/otherwise chain."""
+    bins = [(3.0, "Minor"), (5.0, "Light"), (6.0, "Moderate"), (7.0, "Strong"), (8.0, "Major")]
+    for upper, label in bins:
+        if magnitude < upper:
+            return label
+    return "Great"
+
+
+def _case_depth(depth: float) -> str:
+    """Depth categories as assigned by the former when/otherwise chain."""
+    if depth < 70:
+        return "Shallow"
+    if depth < 300:
+        return "Intermediate"
+    return "Deep"
+
+
+class TestCategoryBins:
+    """The cut-based bins must match the former CASE logic at every boundary."""
+
+    MAGNITUDES = [-1.0, 0.0, 2.99, 3.0, 4.99, 5.0, 5.99, 6.0, 6.99, 7.0, 7.99, 8.0, 9.5]
+    DEPTHS = [-3.0, 0.0, 69.99, 70.0, 70.01, 299.99, 300.0, 700.0]
+
+    def test_magnitude_categories(self, transformer):
+        df = transformer._enrich_data(pl.DataFrame({"magnitude": self.MAGNITUDES}))
+
+        assert df["magnitude_category"].to_list() == [_case_magnitude(m) for m in self.MAGNITUDES]
+
+    def test_depth_categories(self, transformer):
+        df = transformer._enrich_data(pl.DataFrame({"depth": self.DEPTHS}))
+
+        assert df["depth_category"].to_list() == [_case_depth(d) for d in self.DEPTHS]
+
+
+class TestMoonPhaseFast:
+    """The closed-form moon phase against published new and full moon instants."""
+
+    @pytest.mark.parametrize(
+        ("instant", "phase"),
+        [
+            (datetime(2000, 1, 6, 18, 14), 0.0),
+            (datetime(2017, 8, 21, 18, 30), 0.0),
+            (datetime(2022, 11, 8, 11, 2), 0.5),
+            (datetime(2024, 1, 25, 17, 54), 0.5),
+            (datetime(2024, 4, 8, 18, 21), 0.0),
+        ],
+    )
+    def test_within_half_a_degree(self, transformer, instant, phase):
+        value = transformer._moon_phase_fast(pl.Series([instant]))[0]
+
+        # Signed distance in degrees, wrapping around new moon
+        error = ((value - phase + 0.5) % 1.0 - 0.5) * 360
+        assert abs(error) < 0.5
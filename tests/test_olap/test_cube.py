@@ -0,0 +1,87 @@
+"""Tests for OLAP cube creation and incremental refresh."""
+
+import pandas as pd
+import pytest
+
+from src.olap.cube import OLAPCube
+from src.olap.schema import OLAPSchema
+
+
+def _snapshot(conn) -> dict:
+    tables = {}
+    for table in OLAPCube._CUBE_TABLES:
+        df = conn.execute(f"SELECT * FROM {table}").df()
+        tables[table] = df.sort_values(list(df.columns)).reset_index(drop=True)
+    return tables
+
+
+def _assert_same_cubes(actual: dict, expected: dict) -> None:
+    for table, frame in expected.items():
+        pd.testing.assert_frame_equal(
+            actual[table], frame, check_dtype=False, rtol=1e-9, obj=table
+        )
+
+
+@pytest.mark.parametrize("dim_profile", ["full", "lite"])
+def test_refresh_after_append_matches_full_build(config, warehouse, dim_profile, monkeypatch):
+    cube = OLAPCube(config)
+    cube.create_cubes(warehouse, exact_region_counts=True, dim_profile=dim_profile)
+    expected = _snapshot(warehouse)
+
+    # Hold back the latest fifth of the facts, build, then append them again
+    warehouse.execute("CREATE TABLE fact_full AS SELECT * FROM fact_earthquakes")
+    cutoff = warehouse.execute(
+        "SELECT quantile_disc(time_id, 0.8) FROM fact_earthquakes"
+    ).fetchone()[0]
+    warehouse.execute("DELETE FROM fact_earthquakes WHERE time_id > ?", [cutoff])
+    cube.create_cubes(warehouse, exact_region_counts=True, dim_profile=dim_profile)
+    warehouse.execute(
+        "INSERT INTO fact_earthquakes SELECT * FROM fact_full WHERE time_id > ?", [cutoff]
+    )
+
+    # Only the appended facts may be aggregated, not the whole table again
+    monkeypatch.setattr(
+        cube, "create_cubes", lambda *args, **kwargs: pytest.fail("refresh rebuilt all cubes")
+    )
+    cube.refresh_cubes(warehouse, exact_region_counts=True, dim_profile=dim_profile)
+
+    _assert_same_cubes(_snapshot(warehouse), expected)
+
+
+def test_refresh_rebuilds_when_earlier_facts_change(config, warehouse):
+    cube = OLAPCube(config)
+    cube.create_cubes(warehouse, exact_region_counts=True)
+
+    warehouse.execute(
+        "DELETE FROM fact_earthquakes "
+        "WHERE time_id = (SELECT MIN(time_id) FROM fact_earthquakes)"
+    )
+    cube.refresh_cubes(warehouse, exact_region_counts=True)
+    refreshed = _snapshot(warehouse)
+
+    cube.create_cubes(warehouse, exact_region_counts=True)
+    _assert_same_cubes(refreshed, _snapshot(warehouse))
+
+
+def test_refresh_rebuilds_after_star_schema_over_revised_data(config, warehouse):
+    cube = OLAPCube(config)
+    cube.create_cubes(warehouse, exact_region_counts=True)
+
+    # Revised magnitudes keep the fact row count, so only the content changes
+    warehouse.execute(
+        "UPDATE raw_earthquakes SET magnitude = magnitude + 0.5 "
+        "WHERE datetime < (SELECT quantile_disc(datetime, 0.5) FROM raw_earthquakes)"
+    )
+    OLAPSchema(config).create_star_schema(warehouse)
+    cube.refresh_cubes(warehouse, exact_region_counts=True)
+    refreshed = _snapshot(warehouse)
+
+    cube.create_cubes(warehouse, exact_region_counts=True)
+    _assert_same_cubes(refreshed, _snapshot(warehouse))
+
+
+def test_refresh_without_state_builds_cubes(config, warehouse):
+    OLAPCube(config).refresh_cubes(warehouse)
+
+    summary = OLAPCube(config).get_cube_summary(warehouse)
+    assert all(info["exists"] for info in summary.values())
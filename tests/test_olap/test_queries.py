@@ -0,0 +1,220 @@
+"""Tests for the OLAP query layer."""
+
+import math
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.olap.cube import OLAPCube
+from src.olap.queries import (
+    MAP_STREAM_BATCH_ROWS,
+    TOP_EVENTS_ROWS,
+    OLAPQueries,
+    _cached_query,
+    invalidate_query_cache,
+)
+
+
+@pytest.fixture
+def cubes(config, warehouse) -> duckdb.DuckDBPyConnection:
+    """Warehouse connection with the OLAP cubes built."""
+    OLAPCube(config).create_cubes(warehouse, exact_region_counts=True)
+    invalidate_query_cache()
+    return warehouse
+
+
+@pytest.fixture
+def queries(config) -> OLAPQueries:
+    return OLAPQueries(config)
+
+
+class TestCoerceLimit:
+    """Row-limit normalization."""
+
+    def test_none_uses_default(self):
+        assert OLAPQueries._coerce_limit(None, default=25) == 25
+
+    def test_clamps_to_maximum(self):
+        assert OLAPQueries._coerce_limit(10**9, max_=500) == 500
+
+    def test_accepts_integral_values(self):
+        assert OLAPQueries._coerce_limit(0) == 0
+        assert OLAPQueries._coerce_limit(7.0) == 7
+
+    @pytest.mark.parametrize("limit", [-1, 2.5, True, "abc"])
+    def test_rejects_invalid_limits(self, limit):
+        with pytest.raises(ValueError):
+            OLAPQueries._coerce_limit(limit)
+
+
+class TestCoerceMinMagnitude:
+    """Magnitude filter normalization."""
+
+    def test_none_means_no_filter(self):
+        assert OLAPQueries._coerce_min_magnitude(None) == -math.inf
+
+    def test_accepts_negative_magnitudes(self):
+        assert OLAPQueries._coerce_min_magnitude(-0.5) == -0.5
+
+    def test_rejects_nan(self):
+        with pytest.raises(ValueError):
+            OLAPQueries._coerce_min_magnitude(float("nan"))
+
+
+class _CountingQueries:
+    """Stand-in query class recording how often the wrapped query runs."""
+
+    def __init__(self):
+        self.calls = 0
+
+    @_cached_query
+    def run(self, conn, value=0):
+        self.calls += 1
+        return pd.DataFrame({"value": [value], "call": [self.calls]})
+
+
+class TestCachedQuery:
+    """Caching and invalidation of query results."""
+
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        invalidate_query_cache()
+        yield
+        invalidate_query_cache()
+
+    def test_repeated_call_is_served_from_cache(self):
+        queries, conn = _CountingQueries(), duckdb.connect()
+
+        first = queries.run(conn)
+        second = queries.run(conn)
+
+        assert queries.calls == 1
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_cached_frames_are_copies(self):
+        queries, conn = _CountingQueries(), duckdb.connect()
+
+        queries.run(conn)["value"] = 99
+
+        assert queries.run(conn)["value"].tolist() == [0]
+
+    def test_arguments_and_connections_are_separate_entries(self):
+        queries = _CountingQueries()
+        conn_a, conn_b = duckdb.connect(), duckdb.connect()
+
+        queries.run(conn_a, value=1)
+        queries.run(conn_a, value=2)
+        queries.run(conn_b, value=1)
+
+        assert queries.calls == 3
+
+    def test_invalidate_drops_entries(self):
+        queries, conn = _CountingQueries(), duckdb.connect()
+
+        queries.run(conn)
+        invalidate_query_cache()
+        queries.run(conn)
+
+        assert queries.calls == 2
+
+    def test_cube_refresh_invalidates_entries(self):
+        queries, conn = _CountingQueries(), duckdb.connect()
+        conn.execute(
+            "CREATE TABLE cube_refresh_state AS SELECT TIMESTAMP '2024-01-01' AS refreshed_at"
+        )
+
+        queries.run(conn)
+        queries.run(conn)
+        # What a rebuild in another process looks like to this connection
+        conn.execute("UPDATE cube_refresh_state SET refreshed_at = TIMESTAMP '2024-01-02'")
+        queries.run(conn)
+
+        assert queries.calls == 2
+
+
+def test_events_by_region_match_the_fact_table(cubes, queries):
+    expected = cubes.execute("""
+        SELECT l.region, COUNT(*) AS event_count
+        FROM fact_earthquakes f
+        JOIN dim_location l ON f.location_id = l.location_id
+        GROUP BY l.region
+    """).df()
+
+    result = queries.get_events_by_region(cubes, top_n=100)
+
+    assert dict(zip(result["region"], result["event_count"])) == dict(
+        zip(expected["region"], expected["event_count"])
+    )
+    assert result["event_count"].is_monotonic_decreasing
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "get_top_magnitude_events",
+        "get_events_by_region",
+        "get_temporal_trends",
+        "get_magnitude_distribution",
+        "get_depth_analysis",
+        "get_hourly_patterns",
+        "get_seasonal_patterns",
+        "get_moon_phase_analysis",
+        "get_moon_phase_filtered",
+        "get_events_for_map",
+    ],
+)
+def test_arrow_results_match_dataframes(cubes, queries, method):
+    frame = getattr(queries, method)(cubes)
+    table = getattr(queries, method)(cubes, as_arrow=True)
+
+    assert isinstance(table, pa.Table)
+    assert len(frame) > 0
+    pd.testing.assert_frame_equal(table.to_pandas(), frame, check_dtype=False)
+
+
+@pytest.mark.parametrize(
+    ("method", "column", "order"),
+    [
+        (
+            "get_magnitude_distribution",
+            "magnitude_category",
+            ["Minor", "Light", "Moderate", "Strong", "Major", "Great"],
+        ),
+        ("get_depth_analysis", "depth_category", ["Shallow", "Intermediate", "Deep"]),
+        ("get_seasonal_patterns", "season", ["Spring", "Summer", "Fall", "Winter"]),
+    ],
+)
+def test_categories_follow_the_lookup_order(cubes, queries, method, column, order):
+    categories = getattr(queries, method)(cubes)[column].tolist()
+
+    assert categories == [category for category in order if category in categories]
+
+
+def test_streamed_map_events_match_the_table(cubes, queries):
+    reader = queries.get_events_for_map(cubes, min_magnitude=3.0, limit=5000, stream=True)
+    batches = list(reader)
+
+    table = queries.get_events_for_map(cubes, min_magnitude=3.0, limit=5000, as_arrow=True)
+    assert all(batch.num_rows <= MAP_STREAM_BATCH_ROWS for batch in batches)
+    assert pa.Table.from_batches(batches, schema=reader.schema).equals(table)
+
+
+@pytest.mark.parametrize(("threshold", "below"), [(None, -100.0), (4.0, 3.99), (6.0, 5.99)])
+def test_moon_phase_filter_from_cube_matches_fact_table(cubes, queries, threshold, below):
+    # The cube answers group-aligned thresholds; just below one, the same
+    # events are aggregated from the fact table
+    from_cube = queries.get_moon_phase_filtered(cubes, min_magnitude=threshold)
+    from_facts = queries.get_moon_phase_filtered(cubes, min_magnitude=below)
+
+    pd.testing.assert_frame_equal(from_cube, from_facts, check_dtype=False, rtol=1e-9)
+
+
+def test_top_events_from_leader_table_match_the_fact_table(cubes, queries):
+    leaders = queries.get_top_magnitude_events(cubes, limit=20)
+    from_facts = queries.get_top_magnitude_events(cubes, limit=TOP_EVENTS_ROWS + 1)
+
+    assert list(leaders.columns) == list(from_facts.columns)
+    assert len(from_facts) == TOP_EVENTS_ROWS + 1
+    assert leaders["magnitude"].tolist() == from_facts["magnitude"].head(20).tolist()
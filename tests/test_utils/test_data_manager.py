@@ -0,0 +1,98 @@
+"""Tests for incremental-load metadata management."""
+
+import json
+
+import duckdb
+
+from src.utils.data_manager import DataManager, _close_open_managers
+
+
+def _read_metadata(config) -> dict:
+    with open(config.paths.data_dir / "metadata.json") as f:
+        return json.load(f)
+
+
+def test_close_writes_pending_changes(config):
+    manager = DataManager(config)
+    manager.mark_year_loaded(2021)
+    manager.record_year_details(2021, {"row_count": 5})
+
+    manager.close()
+
+    metadata = _read_metadata(config)
+    assert metadata["loaded_years"] == [2021]
+    assert metadata["year_details"]["2021"]["row_count"] == 5
+
+
+def test_context_manager_writes_latest_snapshot(config):
+    with DataManager(config) as manager:
+        for year in range(2000, 2020):
+            manager.mark_year_loaded(year)
+        manager.clear_year(2005)
+
+    assert _read_metadata(config)["loaded_years"] == [y for y in range(2000, 2020) if y != 2005]
+
+
+def test_unclosed_managers_are_drained_at_exit(config):
+    manager = DataManager(config)
+    manager.mark_year_loaded(2022)
+
+    # The atexit hook, run directly
+    _close_open_managers()
+
+    assert _read_metadata(config)["loaded_years"] == [2022]
+    assert manager._writer is None
+
+
+def test_changes_are_visible_to_a_new_manager(config):
+    with DataManager(config) as manager:
+        manager.mark_year_loaded(2023)
+
+    assert DataManager(config).get_loaded_years() == {2023}
+
+
+def test_summary_reports_gaps_and_totals(config):
+    with DataManager(config) as manager:
+        for year in (2010, 2011, 2015):
+            manager.mark_year_loaded(year)
+            manager.record_year_details(year, {"row_count": 10})
+
+        summary = manager.get_summary()
+        assert manager.get_years_to_load(2010, 2016) == [2012, 2013, 2014, 2016]
+        assert manager.get_year_info(2011)["row_count"] == 10
+
+    assert summary["year_range"] == (2010, 2015)
+    assert summary["gaps"] == [(2012, 2014)]
+    assert summary["total_events"] == 30
+
+
+def test_validate_drops_years_without_rows(config):
+    conn = duckdb.connect()
+    conn.execute("CREATE TABLE raw_earthquakes_2021 AS SELECT range AS id FROM range(5)")
+    conn.execute("CREATE TABLE raw_earthquakes_2022 (id INTEGER)")
+
+    with DataManager(config) as manager:
+        for year in (2021, 2022, 2023):
+            manager.mark_year_loaded(year)
+            manager.record_year_details(year, {"row_count": 5})
+
+        assert manager.validate_loaded_years(conn) == [2021]
+
+    metadata = _read_metadata(config)
+    assert metadata["loaded_years"] == [2021]
+    assert list(metadata["year_details"]) == ["2021"]
+
+
+def test_failed_write_keeps_the_previous_file(config, monkeypatch):
+    with DataManager(config) as manager:
+        manager.mark_year_loaded(2021)
+
+    def interrupted_dump(obj, f, **kwargs):
+        f.write('{"loaded_years": [')
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json, "dump", interrupted_dump)
+    with DataManager(config) as manager:
+        manager.mark_year_loaded(2022)
+
+    assert _read_metadata(config)["loaded_years"] == [2021]
@@ -0,0 +1,376 @@
+"""Tests for logging setup and helpers."""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import src.utils.logger as logger_module
+from src.utils.logger import (
+    LoggerMixin,
+    _BlockingQueueHandler,
+    _BufferedFileHandler,
+    _StandardFormatter,
+    _setup_basic_logging,
+    batched_console,
+    get_logger,
+    print_error,
+    print_info,
+    print_section,
+    print_success,
+    print_warning,
+    setup_logging,
+)
+
+LOGGING_YAML = """\
+version: 1
+disable_existing_loggers: false
+handlers:
+  file:
+    class: logging.FileHandler
+    level: DEBUG
+    filename: logs/test.log
+root:
+  level: {level}
+  handlers: [file]
+"""
+
+
+def _record(level: int = logging.INFO, msg: str = "value %s", args: tuple = (1,), exc_info=None):
+    return logging.LogRecord("src.test", level, __file__, 1, msg, args, exc_info)
+
+
+def _message_lines(path) -> list:
+    return [line.rsplit(" - ", 1)[1] for line in path.read_text().splitlines()]
+
+
+def _drain_log_queue() -> None:
+    """Wait until the listener thread has handled every queued record."""
+    logger_module._queue_listener.queue.join()
+
+
+@pytest.fixture
+def fresh_logging(tmp_path, monkeypatch):
+    """Run logging setup inside a temporary directory and restore the root logger after."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "logs").mkdir()
+    for name in ("logThreads", "logProcesses", "logMultiprocessing"):
+        monkeypatch.setattr(logging, name, getattr(logging, name))
+    monkeypatch.setattr(logger_module, "_logs_ready", False)
+    monkeypatch.setattr(logger_module, "_applied_config", None)
+    monkeypatch.setattr(logger_module, "_CONFIG_CACHE", {})
+    # pytest's capture handlers must survive the handler cleanup in setup_logging
+    root.handlers = []
+
+    yield tmp_path
+
+    logger_module._stop_queue_listener()
+    for handler in root.handlers:
+        handler.close()
+    root.handlers = handlers
+    root.setLevel(level)
+
+
+class TestStandardFormatter:
+    """The f-string formatter against the %-style format it replaces."""
+
+    def test_matches_percent_style_format(self):
+        percent = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s", "%Y-%m-%d %H:%M:%S"
+        )
+        record = _record()
+
+        assert _StandardFormatter().format(record) == percent.format(record)
+
+    def test_appends_exception_text(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = _record(logging.ERROR, exc_info=sys.exc_info())
+
+        first, _, rest = _StandardFormatter().format(record).partition("\n")
+
+        assert first.endswith(" - src.test - ERROR - value 1")
+        assert rest.startswith("Traceback") and rest.endswith("ValueError: boom")
+
+    def test_reuses_timestamp_within_a_second(self, monkeypatch):
+        calls = []
+        format_time = logging.Formatter.formatTime
+
+        def counting_format_time(self, record, datefmt=None):
+            calls.append(record)
+            return format_time(self, record, datefmt)
+
+        monkeypatch.setattr(logging.Formatter, "formatTime", counting_format_time)
+        formatter = _StandardFormatter()
+        records = [_record() for _ in range(3)]
+        for record, created in zip(records, [1_700_000_000.1, 1_700_000_000.9, 1_700_000_001.0]):
+            record.created = created
+
+        stamps = [formatter.formatTime(record, formatter.datefmt) for record in records]
+
+        assert stamps[0] == stamps[1] != stamps[2]
+        assert len(calls) == 2
+
+
+class TestBufferedFileHandler:
+    """Buffered byte writes of the fallback file log."""
+
+    @staticmethod
+    def _handler(path):
+        handler = _BufferedFileHandler(str(path))
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        return handler
+
+    def test_info_records_are_written_on_close(self, tmp_path):
+        path = tmp_path / "app.log"
+        handler = self._handler(path)
+
+        handler.handle(_record(msg="Ωmega %s"))
+        assert path.read_bytes() == b""
+
+        handler.close()
+        assert path.read_text(encoding="utf-8") == "Ωmega 1\n"
+
+    def test_warnings_are_flushed_immediately(self, tmp_path):
+        path = tmp_path / "app.log"
+        handler = self._handler(path)
+
+        handler.handle(_record())
+        handler.handle(_record(logging.WARNING, args=(2,)))
+
+        assert path.read_text() == "value 1\nvalue 2\n"
+        handler.close()
+
+
+class TestFallbackLogging:
+    """Fallback setup used when there is no logging config file."""
+
+    def test_file_log_is_written_once_a_warning_arrives(self, fresh_logging):
+        log_file = fresh_logging / "logs" / "earthquake_olap.log"
+        _setup_basic_logging(use_rich=False)
+        logger = logging.getLogger("src.test")
+
+        logger.info("first")
+        _drain_log_queue()
+        assert log_file.read_text() == ""
+
+        logger.warning("second")
+        _drain_log_queue()
+        assert _message_lines(log_file) == ["first", "second"]
+
+    def test_handlers_run_on_the_listener_thread(self, fresh_logging):
+        _setup_basic_logging(use_rich=False)
+
+        root_handlers = logging.getLogger().handlers
+        assert [type(handler) for handler in root_handlers] == [_BlockingQueueHandler]
+        assert logger_module._queue_listener is not None
+
+    def test_stopping_the_listener_flushes_the_file_log(self, fresh_logging):
+        log_file = fresh_logging / "logs" / "earthquake_olap.log"
+        _setup_basic_logging(use_rich=False)
+
+        logging.getLogger("src.test").info("pending")
+        logger_module._stop_queue_listener()
+
+        assert _message_lines(log_file) == ["pending"]
+        assert logger_module._queue_listener is None
+
+    def test_existing_root_handlers_are_closed(self, fresh_logging):
+        closed = []
+        handler = logging.Handler()
+        handler.close = lambda: closed.append(handler)
+        logging.getLogger().addHandler(handler)
+
+        _setup_basic_logging(use_rich=False)
+
+        assert closed == [handler]
+        assert handler not in logging.getLogger().handlers
+
+    def test_repeated_setup_only_changes_the_console_level(self, fresh_logging):
+        _setup_basic_logging(logging.INFO, use_rich=False)
+        listener = logger_module._queue_listener
+
+        _setup_basic_logging(logging.DEBUG, use_rich=False)
+
+        assert logger_module._queue_listener is listener
+        assert listener.handlers[0].level == logging.DEBUG
+
+
+class TestBlockingQueueHandler:
+    """Records handed to the listener thread."""
+
+    def test_prepare_merges_args_and_keeps_exc_info(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        record = _record(logging.ERROR, args=([1],), exc_info=exc_info)
+
+        prepared = _BlockingQueueHandler(None).prepare(record)
+        record.args[0].append(2)
+
+        assert (prepared.msg, prepared.args) == ("value [1]", None)
+        assert prepared.exc_info is exc_info
+
+
+class TestPrintHelpers:
+    """Plain-text output of the print helpers when stdout is not a terminal."""
+
+    @pytest.fixture(autouse=True)
+    def _plain_console(self, monkeypatch):
+        monkeypatch.setattr(logger_module, "_RICH_CONSOLE", False)
+
+    def test_plain_text_lines(self, capsys):
+        print_info("a")
+        print_success("b")
+        print_warning("c")
+        print_error("d")
+        print_section("e")
+
+        assert capsys.readouterr().out == "[INFO] a\n[OK] b\n[WARNING] c\n[ERROR] d\n---- e ----\n"
+
+    def test_batched_console_writes_once(self, monkeypatch):
+        writes = []
+        monkeypatch.setattr(sys, "stdout", SimpleNamespace(write=writes.append))
+
+        with batched_console():
+            print_info("a")
+            print_info("b")
+            assert writes == []
+
+        assert writes == ["[INFO] a\n[INFO] b\n"]
+
+    def test_nested_batches_join_the_outer_one(self, monkeypatch):
+        writes = []
+        monkeypatch.setattr(sys, "stdout", SimpleNamespace(write=writes.append))
+
+        with batched_console():
+            print_info("a")
+            with batched_console():
+                print_info("b")
+            print_info("c")
+
+        assert writes == ["[INFO] a\n[INFO] b\n[INFO] c\n"]
+
+
+class TestSetupLogging:
+    """Loading the logging config file."""
+
+    @staticmethod
+    def _write_config(path, level: str = "INFO"):
+        path.write_text(LOGGING_YAML.format(level=level))
+        return path
+
+    def test_config_is_parsed_once_per_file_version(self, fresh_logging, monkeypatch):
+        calls = []
+        read_config = logger_module._read_config
+
+        def counting_read_config(path):
+            calls.append(path)
+            return read_config(path)
+
+        monkeypatch.setattr(logger_module, "_read_config", counting_read_config)
+        config_file = self._write_config(fresh_logging / "logging.yaml")
+
+        setup_logging(str(config_file))
+        setup_logging(str(config_file))
+        assert len(calls) == 1
+
+        self._write_config(config_file, level="DEBUG")
+        setup_logging(str(config_file))
+        assert len(calls) == 2
+        assert logging.getLogger().level == logging.DEBUG
+
+    def test_creates_the_logs_directory(self, fresh_logging):
+        (fresh_logging / "logs").rmdir()
+
+        setup_logging(str(fresh_logging / "missing.yaml"))
+
+        assert (fresh_logging / "logs").is_dir()
+        assert logger_module._logs_ready
+
+    def test_repeated_setup_keeps_the_configured_handlers(self, fresh_logging):
+        config_file = self._write_config(fresh_logging / "logging.yaml")
+
+        setup_logging(str(config_file))
+        handlers = logging.getLogger().handlers[:]
+        setup_logging(str(config_file))
+
+        assert logging.getLogger().handlers == handlers
+
+    def test_prefers_an_up_to_date_json_copy(self, fresh_logging):
+        config_file = self._write_config(fresh_logging / "logging.yaml")
+        json_config = {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "root": {"level": "WARNING", "handlers": []},
+        }
+        json_file = fresh_logging / "logging.json"
+        json_file.write_text(json.dumps(json_config))
+        yaml_mtime = config_file.stat().st_mtime_ns
+
+        os.utime(json_file, ns=(yaml_mtime, yaml_mtime))
+        setup_logging(str(config_file))
+        assert logging.getLogger().level == logging.WARNING
+
+        # A JSON copy older than the YAML file is stale and ignored
+        os.utime(json_file, ns=(yaml_mtime - 10**9, yaml_mtime - 10**9))
+        setup_logging(str(config_file))
+        assert logging.getLogger().level == logging.INFO
+
+
+class _Component(LoggerMixin):
+    """LoggerMixin subclass used by the tests below."""
+
+
+class TestLoggerMixin:
+    """Per-class loggers and the guarded debug helpers."""
+
+    def test_logger_is_named_after_the_class(self):
+        assert _Component().logger.name == f"{__name__}._Component"
+
+    def test_lazy_values_are_skipped_when_debug_is_off(self, caplog):
+        calls = []
+        caplog.set_level(logging.INFO, logger=_Component._logger.name)
+
+        _Component().log_debug_lazy("rows: %s", lambda: calls.append(1) or 5)
+
+        assert calls == []
+        assert caplog.records == []
+
+    def test_lazy_values_are_computed_when_debug_is_on(self, caplog):
+        caplog.set_level(logging.DEBUG, logger=_Component._logger.name)
+
+        _Component().log_debug_lazy("rows: %s", lambda: 5)
+        _Component().log_debug("cols: %s", 3)
+
+        assert [record.getMessage() for record in caplog.records] == ["rows: 5", "cols: 3"]
+        assert caplog.records[0].funcName == "test_lazy_values_are_computed_when_debug_is_on"
+
+
+def test_import_does_not_load_rich_or_yaml():
+    code = "import sys, src.utils.logger; print(sorted({'rich', 'yaml'} & set(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parents[2],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_get_logger_interns_the_name():
+    name = ".".join(["src", "runtime", "Name"])
+
+    assert get_logger(name).name is sys.intern("src.runtime.Name")